@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 
 from bleak import BleakClient, BleakScanner
 from bleak.exc import BleakError
@@ -28,7 +29,12 @@ from .const import (
     ATTR_CHARACTERISTIC_UUID,
     ATTR_DATA,
     DEVICE_NAME_UUID,
+    TIMEOUT_CONNECT,
+    TIMEOUT_SCAN,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
 )
+from .coordinator import EM1003DataUpdateCoordinator, EM1003EntryData
 from .device import EM1003Device
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,6 +42,10 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
 
+def _noop_disconnect(_client: BleakClient) -> None:
+    """Disconnect callback for the short-lived debug service connections."""
+
+
 async def async_read_device_name(hass: HomeAssistant, mac_address: str) -> str | None:
     """Read device name from BLE device using Device Name characteristic.
 
@@ -57,9 +67,9 @@ async def async_read_device_name(hass: HomeAssistant, mac_address: str) -> str |
             BleakClient,
             device,
             mac_address,
-            disconnected_callback=lambda _: None,
+            disconnected_callback=_noop_disconnect,
             max_attempts=3,  # Reduced to avoid overwhelming Bluetooth stack
-            timeout=30.0,
+            timeout=TIMEOUT_CONNECT,
         )
 
         try:
@@ -102,6 +112,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create EM1003 device instance with device name
     em1003_device = EM1003Device(hass, mac_address, device_name)
+    # The name read may have just disconnected; the first poll waits only as long
+    # as the device's own reconnect delay still requires
+    em1003_device.note_disconnect()
 
     # Register device in device registry before creating entities
     device_registry = dr.async_get(hass)
@@ -115,14 +128,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     _LOGGER.info("Device registered in device registry: %s", device_name)
 
+    # Get scan interval from options or use default
+    scan_interval_seconds = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    _LOGGER.info("Using scan interval: %d seconds", scan_interval_seconds)
+
+    # One coordinator per device; every sensor and the switch share its polls
+    coordinator = EM1003DataUpdateCoordinator(
+        hass, em1003_device, mac_address, timedelta(seconds=scan_interval_seconds)
+    )
+
     # Store device info in hass.data
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        CONF_MAC_ADDRESS: mac_address,
-        "name": entry.title,
-        "device_name": device_name,
-        "device": em1003_device,
-    }
+    hass.data[DOMAIN][entry.entry_id] = EM1003EntryData(
+        mac_address, device_name, em1003_device, coordinator
+    )
+
+    # Fetch initial data with better error handling
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception as err:
+        _LOGGER.warning(
+            "Initial data fetch failed for %s, sensors will retry automatically: %s",
+            mac_address,
+            err
+        )
+        # Don't fail setup - let sensors show unavailable and retry later
 
     # Register services
     await async_setup_services(hass)
@@ -135,7 +165,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data: EM1003EntryData = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data.device.async_shutdown()
 
     return unload_ok
 
@@ -169,7 +200,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
                 # Also try a general scan
                 _LOGGER.info("Performing general BLE scan...")
-                devices = await BleakScanner.discover(timeout=10.0)
+                devices = await BleakScanner.discover(timeout=TIMEOUT_SCAN)
                 _LOGGER.info("Found %d BLE devices:", len(devices))
                 for dev in devices:
                     _LOGGER.info("  - %s (%s) RSSI: %s", dev.name or "Unknown", dev.address, dev.rssi)
@@ -196,9 +227,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 BleakClient,
                 device,
                 mac_address,
-                disconnected_callback=lambda _: None,
+                disconnected_callback=_noop_disconnect,
                 max_attempts=3,  # Reduced to avoid overwhelming Bluetooth stack
-                timeout=30.0,
+                timeout=TIMEOUT_CONNECT,
             )
 
             try:
@@ -266,9 +297,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 BleakClient,
                 device,
                 mac_address,
-                disconnected_callback=lambda _: None,
+                disconnected_callback=_noop_disconnect,
                 max_attempts=3,  # Reduced to avoid overwhelming Bluetooth stack
-                timeout=30.0,
+                timeout=TIMEOUT_CONNECT,
             )
 
             try:
@@ -307,9 +338,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 BleakClient,
                 device,
                 mac_address,
-                disconnected_callback=lambda _: None,
+                disconnected_callback=_noop_disconnect,
                 max_attempts=3,  # Reduced to avoid overwhelming Bluetooth stack
-                timeout=30.0,
+                timeout=TIMEOUT_CONNECT,
             )
 
             try:
@@ -368,9 +399,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 BleakClient,
                 device,
                 mac_address,
-                disconnected_callback=lambda _: None,
+                disconnected_callback=_noop_disconnect,
                 max_attempts=3,  # Reduced to avoid overwhelming Bluetooth stack
-                timeout=30.0,
+                timeout=TIMEOUT_CONNECT,
             )
 
             try:
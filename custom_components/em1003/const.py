@@ -1,133 +1,244 @@
 """Constants for the EM1003 BLE Sensor integration."""
+from __future__ import annotations
 
-DOMAIN = "em1003"
-CONF_MAC_ADDRESS = "mac_address"
+from array import array
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final, NamedTuple
+
+__all__ = (
+    "DOMAIN",
+    "CONF_MAC_ADDRESS",
+    "SERVICE_SCAN_DEVICE",
+    "SERVICE_READ_CHARACTERISTIC",
+    "SERVICE_WRITE_CHARACTERISTIC",
+    "SERVICE_LIST_SERVICES",
+    "SERVICE_DISCOVER_ALL",
+    "SERVICE_READ_DEVICE_NAME",
+    "ATTR_MAC_ADDRESS",
+    "ATTR_SERVICE_UUID",
+    "ATTR_CHARACTERISTIC_UUID",
+    "ATTR_DATA",
+    "DEVICE_NAME_UUID",
+    "EM1003_SERVICE_UUID",
+    "EM1003_WRITE_CHAR_UUID",
+    "EM1003_NOTIFY_CHAR_UUID",
+    "CMD_READ_SENSOR",
+    "CMD_BUZZER",
+    "CMD_BUZZER_SET_RESPONSE",
+    "BUZZER_OFF",
+    "BUZZER_ON",
+    "SENSOR_ID_01",
+    "SENSOR_ID_06",
+    "SENSOR_ID_08",
+    "SENSOR_ID_09",
+    "SENSOR_ID_0A",
+    "SENSOR_ID_11",
+    "SENSOR_ID_12",
+    "SENSOR_ID_13",
+    "SensorDef",
+    "SENSOR_TYPES",
+    "SENSOR_NOTES",
+    "SENSOR_IDS",
+    "SENSOR_TYPES_ITEMS",
+    "SENSOR_OFFSET",
+    "SENSOR_DIVISOR",
+    "NON_NEGATIVE_SENSOR_IDS",
+    "PROBLEMATIC_SENSOR_IDS",
+    "BUZZER_QUERY_FRAME",
+    "BUZZER_SET_FRAMES",
+    "CONF_SCAN_INTERVAL",
+    "DEFAULT_NAME",
+    "DEFAULT_SCAN_INTERVAL",
+    "TIMEOUT_SCAN",
+    "TIMEOUT_CONNECT",
+    "TIMEOUT_RESPONSE",
+    "DEVICE_TIMEOUT",
+    "VERSION",
+)
+
+DOMAIN: Final[str] = "em1003"
+CONF_MAC_ADDRESS: Final[str] = "mac_address"
 
 # Service names
-SERVICE_SCAN_DEVICE = "scan_device"
-SERVICE_READ_CHARACTERISTIC = "read_characteristic"
-SERVICE_WRITE_CHARACTERISTIC = "write_characteristic"
-SERVICE_LIST_SERVICES = "list_services"
-SERVICE_DISCOVER_ALL = "discover_all"
-SERVICE_READ_DEVICE_NAME = "read_device_name"
+SERVICE_SCAN_DEVICE: Final[str] = "scan_device"
+SERVICE_READ_CHARACTERISTIC: Final[str] = "read_characteristic"
+SERVICE_WRITE_CHARACTERISTIC: Final[str] = "write_characteristic"
+SERVICE_LIST_SERVICES: Final[str] = "list_services"
+SERVICE_DISCOVER_ALL: Final[str] = "discover_all"
+SERVICE_READ_DEVICE_NAME: Final[str] = "read_device_name"
 
 # Attribute names
-ATTR_MAC_ADDRESS = "mac_address"
-ATTR_SERVICE_UUID = "service_uuid"
-ATTR_CHARACTERISTIC_UUID = "characteristic_uuid"
-ATTR_DATA = "data"
+ATTR_MAC_ADDRESS: Final[str] = "mac_address"
+ATTR_SERVICE_UUID: Final[str] = "service_uuid"
+ATTR_CHARACTERISTIC_UUID: Final[str] = "characteristic_uuid"
+ATTR_DATA: Final[str] = "data"
 
-# BLE UUIDs
+# BLE UUIDs (lowercase 128-bit form, as produced by bleak.uuids.normalize_uuid_str)
 # Standard BLE GATT Characteristics
-DEVICE_NAME_UUID = "00002A00-0000-1000-8000-00805F9B34FB"  # Device Name characteristic
+DEVICE_NAME_UUID: Final[str] = "00002a00-0000-1000-8000-00805f9b34fb"  # Device Name characteristic
 
 # EM1003 Custom Service and Characteristics
-EM1003_SERVICE_UUID = "09de2880-1415-4e2c-a48a-3938e3288537"  # Unknown service for sensor data
-EM1003_WRITE_CHAR_UUID = "0000FFF1-0000-1000-8000-00805F9B34FB"  # Write characteristic (0xFFF1)
-EM1003_NOTIFY_CHAR_UUID = "0000FFF4-0000-1000-8000-00805F9B34FB"  # Notify characteristic (0xFFF4)
+EM1003_SERVICE_UUID: Final[str] = "09de2880-1415-4e2c-a48a-3938e3288537"  # Unknown service for sensor data
+EM1003_WRITE_CHAR_UUID: Final[str] = "0000fff1-0000-1000-8000-00805f9b34fb"  # Write characteristic (0xFFF1)
+EM1003_NOTIFY_CHAR_UUID: Final[str] = "0000fff4-0000-1000-8000-00805f9b34fb"  # Notify characteristic (0xFFF4)
 
 # Protocol Commands
-CMD_READ_SENSOR = 0x06  # Command to read sensor data
-CMD_BUZZER = 0x50  # Command for buzzer control
-CMD_BUZZER_SET_RESPONSE = 0x05  # Response command for buzzer set operations
+CMD_READ_SENSOR: Final[int] = 0x06  # Command to read sensor data
+CMD_BUZZER: Final[int] = 0x50  # Command for buzzer control
+CMD_BUZZER_SET_RESPONSE: Final[int] = 0x05  # Response command for buzzer set operations
 
 # Buzzer states
-BUZZER_OFF = 0x00  # Buzzer off
-BUZZER_ON = 0x01  # Buzzer on
+BUZZER_OFF: Final[int] = 0x00  # Buzzer off
+BUZZER_ON: Final[int] = 0x01  # Buzzer on
 
 # Sensor IDs (all confirmed through testing)
-SENSOR_ID_01 = 0x01  # ✓ Confirmed: Temperature (°C) - formula: (raw - 4000) / 100
-SENSOR_ID_06 = 0x06  # ✓ Confirmed: Humidity (%) - formula: raw / 100
-SENSOR_ID_08 = 0x08  # ✓ Confirmed: Noise Level (dB)
-SENSOR_ID_09 = 0x09  # ✓ Confirmed: PM2.5 (µg/m³)
-SENSOR_ID_0A = 0x0A  # ✓ Confirmed: Formaldehyde (mg/m³) - formula: (raw - 16384) / 1000
-SENSOR_ID_11 = 0x11  # ✓ Confirmed: PM10 (µg/m³)
-SENSOR_ID_12 = 0x12  # ✓ Confirmed: TVOC (mg/m³) - formula: raw × 0.001
-SENSOR_ID_13 = 0x13  # ✓ Confirmed: eCO2 (ppm)
+SENSOR_ID_01: Final[int] = 0x01  # ✓ Confirmed: Temperature (°C) - formula: (raw - 4000) / 100
+SENSOR_ID_06: Final[int] = 0x06  # ✓ Confirmed: Humidity (%) - formula: raw / 100
+SENSOR_ID_08: Final[int] = 0x08  # ✓ Confirmed: Noise Level (dB)
+SENSOR_ID_09: Final[int] = 0x09  # ✓ Confirmed: PM2.5 (µg/m³)
+SENSOR_ID_0A: Final[int] = 0x0A  # ✓ Confirmed: Formaldehyde (mg/m³) - formula: (raw - 16384) / 1000
+SENSOR_ID_11: Final[int] = 0x11  # ✓ Confirmed: PM10 (µg/m³)
+SENSOR_ID_12: Final[int] = 0x12  # ✓ Confirmed: TVOC (mg/m³) - formula: raw × 0.001
+SENSOR_ID_13: Final[int] = 0x13  # ✓ Confirmed: eCO2 (ppm)
+
+
+class SensorDef(NamedTuple):
+    """Static definition of an EM1003 sensor."""
+
+    id: int
+    name: str
+    key: str
+    icon: str
+    device_class: str | None
+    unit: str | None
+
 
 # Sensor definitions
-SENSOR_TYPES = {
-    SENSOR_ID_01: {
-        "id": SENSOR_ID_01,
-        "name": "Temperature",
-        "key": "temperature",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-        "unit": "°C",
-        "note": "Confirmed: Temperature with offset encoding - formula: (raw - 4000) / 100",
-    },
-    SENSOR_ID_06: {
-        "id": SENSOR_ID_06,
-        "name": "Humidity",
-        "key": "humidity",
-        "icon": "mdi:water-percent",
-        "device_class": "humidity",
-        "unit": "%",
-        "note": "Confirmed: Relative humidity - formula: raw / 100",
-    },
-    SENSOR_ID_08: {
-        "id": SENSOR_ID_08,
-        "name": "Noise Level",
-        "key": "noise",
-        "icon": "mdi:volume-high",
-        "device_class": None,
-        "unit": "dB",
-        "note": "Confirmed: Noise level in decibels",
-    },
-    SENSOR_ID_09: {
-        "id": SENSOR_ID_09,
-        "name": "PM2.5",
-        "key": "pm25",
-        "icon": "mdi:air-filter",
-        "device_class": "pm25",
-        "unit": "µg/m³",
-        "note": "Confirmed: Particulate Matter 2.5µm",
-    },
-    SENSOR_ID_0A: {
-        "id": SENSOR_ID_0A,
-        "name": "Formaldehyde",
-        "key": "formaldehyde",
-        "icon": "mdi:chemical-weapon",
-        "device_class": None,
-        "unit": "mg/m³",
-        "note": "Confirmed: Formaldehyde (HCHO) with offset - formula: (raw - 16384) / 1000",
-    },
-    SENSOR_ID_11: {
-        "id": SENSOR_ID_11,
-        "name": "PM10",
-        "key": "pm10",
-        "icon": "mdi:air-filter",
-        "device_class": "pm10",
-        "unit": "µg/m³",
-        "note": "Confirmed: Particulate Matter 10µm",
-    },
-    SENSOR_ID_12: {
-        "id": SENSOR_ID_12,
-        "name": "TVOC",
-        "key": "tvoc",
-        "icon": "mdi:molecule",
-        "device_class": "volatile_organic_compounds",
-        "unit": "µg/m³",
-        "note": "Confirmed: Total Volatile Organic Compounds (raw value is µg/m³)",
-    },
-    SENSOR_ID_13: {
-        "id": SENSOR_ID_13,
-        "name": "eCO2",
-        "key": "eco2",
-        "icon": "mdi:molecule-co2",
-        "device_class": "carbon_dioxide",
-        "unit": "ppm",
-        "note": "Confirmed: Equivalent CO2",
-    },
-}
+SENSOR_TYPES: Final[Mapping[int, SensorDef]] = MappingProxyType({
+    SENSOR_ID_01: SensorDef(
+        id=SENSOR_ID_01,
+        name="Temperature",
+        key="temperature",
+        icon="mdi:thermometer",
+        device_class="temperature",
+        unit="°C",
+    ),
+    SENSOR_ID_06: SensorDef(
+        id=SENSOR_ID_06,
+        name="Humidity",
+        key="humidity",
+        icon="mdi:water-percent",
+        device_class="humidity",
+        unit="%",
+    ),
+    SENSOR_ID_08: SensorDef(
+        id=SENSOR_ID_08,
+        name="Noise Level",
+        key="noise",
+        icon="mdi:volume-high",
+        device_class=None,
+        unit="dB",
+    ),
+    SENSOR_ID_09: SensorDef(
+        id=SENSOR_ID_09,
+        name="PM2.5",
+        key="pm25",
+        icon="mdi:air-filter",
+        device_class="pm25",
+        unit="µg/m³",
+    ),
+    SENSOR_ID_0A: SensorDef(
+        id=SENSOR_ID_0A,
+        name="Formaldehyde",
+        key="formaldehyde",
+        icon="mdi:chemical-weapon",
+        device_class=None,
+        unit="mg/m³",
+    ),
+    SENSOR_ID_11: SensorDef(
+        id=SENSOR_ID_11,
+        name="PM10",
+        key="pm10",
+        icon="mdi:air-filter",
+        device_class="pm10",
+        unit="µg/m³",
+    ),
+    SENSOR_ID_12: SensorDef(
+        id=SENSOR_ID_12,
+        name="TVOC",
+        key="tvoc",
+        icon="mdi:molecule",
+        device_class="volatile_organic_compounds",
+        unit="µg/m³",
+    ),
+    SENSOR_ID_13: SensorDef(
+        id=SENSOR_ID_13,
+        name="eCO2",
+        key="eco2",
+        icon="mdi:molecule-co2",
+        device_class="carbon_dioxide",
+        unit="ppm",
+    ),
+})
+
+# Human-readable sensor notes, exposed as entity attributes
+SENSOR_NOTES: Final[Mapping[int, str]] = MappingProxyType({
+    SENSOR_ID_01: "Confirmed: Temperature with offset encoding - formula: (raw - 4000) / 100",
+    SENSOR_ID_06: "Confirmed: Relative humidity - formula: raw / 100",
+    SENSOR_ID_08: "Confirmed: Noise level in decibels",
+    SENSOR_ID_09: "Confirmed: Particulate Matter 2.5µm",
+    SENSOR_ID_0A: "Confirmed: Formaldehyde (HCHO) with offset - formula: (raw - 16384) / 1000",
+    SENSOR_ID_11: "Confirmed: Particulate Matter 10µm",
+    SENSOR_ID_12: "Confirmed: Total Volatile Organic Compounds (raw value is µg/m³)",
+    SENSOR_ID_13: "Confirmed: Equivalent CO2",
+})
+
+# Sensor IDs in polling order
+SENSOR_IDS: Final[tuple[int, ...]] = tuple(SENSOR_TYPES)
+SENSOR_TYPES_ITEMS: Final[tuple[tuple[int, SensorDef], ...]] = tuple(SENSOR_TYPES.items())
+
+# Per-sensor fixed-point scaling, indexed by sensor ID byte: value = (raw - offset) / divisor
+# Offsets and divisors are integers; sensors not listed here use the raw value (offset 0, divisor 1)
+_SENSOR_OFFSET: Final[array] = array("i", [0] * 256)
+_SENSOR_DIVISOR: Final[array] = array("i", [1] * 256)
+_SENSOR_OFFSET[SENSOR_ID_01] = 4000  # Temperature: (raw - 4000) / 100
+_SENSOR_DIVISOR[SENSOR_ID_01] = 100
+_SENSOR_DIVISOR[SENSOR_ID_06] = 100  # Humidity: raw / 100
+_SENSOR_OFFSET[SENSOR_ID_0A] = 16384  # Formaldehyde: (raw - 16384) / 1000
+_SENSOR_DIVISOR[SENSOR_ID_0A] = 1000
+
+# Sensors whose readings cannot be negative; negative values are dropped as invalid
+# (Humidity, Noise, PM2.5, Formaldehyde, PM10, TVOC, eCO2)
+NON_NEGATIVE_SENSOR_IDS: Final[frozenset[int]] = frozenset(SENSOR_IDS) - {SENSOR_ID_01}
+
+# Sensors that often fail to report (PM10, TVOC, eCO2); their reads are logged in detail
+PROBLEMATIC_SENSOR_IDS: Final[tuple[int, ...]] = (SENSOR_ID_11, SENSOR_ID_12, SENSOR_ID_13)
+
+# Read-only buffer views of the scaling tables. They support the buffer protocol,
+# so batch consumers can wrap them without copying (e.g. numpy.frombuffer)
+SENSOR_OFFSET: Final[memoryview] = memoryview(_SENSOR_OFFSET).toreadonly()
+SENSOR_DIVISOR: Final[memoryview] = memoryview(_SENSOR_DIVISOR).toreadonly()
+
+# Pre-encoded request payloads (everything after the leading sequence ID byte)
+BUZZER_QUERY_FRAME: Final[bytes] = bytes((CMD_BUZZER, 0x00))
+BUZZER_SET_FRAMES: Final[Mapping[int, bytes]] = MappingProxyType({
+    BUZZER_ON: bytes((CMD_BUZZER, 0x01, BUZZER_ON)),
+    BUZZER_OFF: bytes((CMD_BUZZER, 0x01, BUZZER_OFF)),
+})
 
 # Configuration keys
-CONF_SCAN_INTERVAL = "scan_interval"
+CONF_SCAN_INTERVAL: Final[str] = "scan_interval"
 
 # Default values
-DEFAULT_NAME = "EM1003"
-DEFAULT_SCAN_INTERVAL = 60  # Default polling interval in seconds
-DEVICE_TIMEOUT = 30.0
+DEFAULT_NAME: Final[str] = "EM1003"
+DEFAULT_SCAN_INTERVAL: Final[int] = 60  # Default polling interval in seconds
+
+# Per-operation timeouts in seconds
+TIMEOUT_SCAN: Final[float] = 10.0  # General BLE discovery scan
+TIMEOUT_CONNECT: Final[float] = 30.0  # Single connection attempt (incl. service resolution)
+TIMEOUT_RESPONSE: Final[float] = 2.0  # Notification response to a single request
+DEVICE_TIMEOUT: Final[float] = TIMEOUT_CONNECT  # Backwards-compatible alias
 
 # Version
-VERSION = "1.0.3"
+VERSION: Final[str] = "1.0.3"
@@ -0,0 +1,104 @@
+"""Data update coordinator for EM1003 BLE Sensor integration."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import timedelta
+from typing import NamedTuple
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import PROBLEMATIC_SENSOR_IDS, SENSOR_TYPES
+from .device import EM1003Device
+
+_LOGGER = logging.getLogger(__name__)
+
+# Names of the sensors that often fail to report; missing values are logged
+_PROBLEMATIC_SENSOR_NAMES = {
+    sid: SENSOR_TYPES[sid].name if sid in SENSOR_TYPES else f"0x{sid:02x}"
+    for sid in PROBLEMATIC_SENSOR_IDS
+}
+
+
+class EM1003Data(NamedTuple):
+    """Result of one poll.
+
+    The buzzer state is part of the result so that a buzzer-only change still
+    counts as new data and reaches the switch's listener.
+    """
+
+    sensors: dict[int, float | None]
+    buzzer: bool | None
+
+
+class EM1003DataUpdateCoordinator(DataUpdateCoordinator[EM1003Data]):
+    """Class to manage fetching EM1003 data from the device."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        em1003_device,
+        mac_address: str,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"EM1003 {mac_address}",
+            update_interval=update_interval,
+            # Only notify listeners when the readings actually change
+            always_update=False,
+        )
+        self.em1003_device = em1003_device
+        self.mac_address = mac_address
+        # time.monotonic() at which each sensor last reported a value in a
+        # successful poll. Listeners only run when readings change, so entities
+        # age their cached values from this instead
+        self.sensor_last_seen: dict[int, float] = {}
+
+    async def _async_update_data(self) -> EM1003Data:
+        """Fetch data from the device."""
+        try:
+            _LOGGER.debug("Updating sensor data for %s", self.mac_address)
+            # The poll also refreshes em1003_device.buzzer_state on the same
+            # connection, keeping the switch in sync without a second connect
+            data = await self.em1003_device.read_all_sensors()
+
+            # Check if we actually received any valid data
+            valid_count = len(data) - list(data.values()).count(None)
+            if valid_count == 0:
+                raise UpdateFailed(
+                    f"Failed to read any sensor data from {self.mac_address} - "
+                    "connection or device issue"
+                )
+
+            _LOGGER.debug("Sensor data updated: %s (valid: %d/%d)", data, valid_count, len(data))
+
+            seen = time.monotonic()
+            for sensor_id, value in data.items():
+                if value is not None:
+                    self.sensor_last_seen[sensor_id] = seen
+
+            # Log if problematic sensors have no data
+            if data:
+                for sensor_id, sensor_name in _PROBLEMATIC_SENSOR_NAMES.items():
+                    if data.get(sensor_id) is None:
+                        _LOGGER.info("[%s] No data received", sensor_name)
+
+            return EM1003Data(data, self.em1003_device.buzzer_state)
+        except Exception as err:
+            raise UpdateFailed(f"Error communicating with device: {err}") from err
+
+
+class EM1003EntryData(NamedTuple):
+    """Per config entry objects shared with the platforms via hass.data."""
+
+    mac_address: str
+    device_name: str
+    device: EM1003Device
+    coordinator: EM1003DataUpdateCoordinator
@@ -4,12 +4,17 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import re
+import struct
 import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
+from enum import IntEnum
 
 from bleak import BleakClient
 from bleak.exc import BleakError
-from bleak_retry_connector import establish_connection
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant
@@ -20,22 +25,65 @@ from .const import (
     CMD_BUZZER_SET_RESPONSE,
     BUZZER_ON,
     BUZZER_OFF,
+    BUZZER_QUERY_FRAME,
+    BUZZER_SET_FRAMES,
     EM1003_NOTIFY_CHAR_UUID,
+    EM1003_SERVICE_UUID,
     EM1003_WRITE_CHAR_UUID,
     SENSOR_TYPES,
+    SENSOR_IDS,
+    SENSOR_OFFSET,
+    SENSOR_DIVISOR,
+    NON_NEGATIVE_SENSOR_IDS,
+    PROBLEMATIC_SENSOR_IDS,
+    TIMEOUT_CONNECT,
+    TIMEOUT_RESPONSE,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sensor values are unsigned 16-bit little-endian words following the 3-byte header
+_U16LE_UNPACK = struct.Struct("<H").unpack_from
+
+# Connection error message keywords mapped to their root-cause category
+_CONN_ERROR_CATEGORIES = {
+    "connection abort": "abort",  # Also matches "software caused connection abort"
+    "timeout": "timeout",
+    "device unreachable": "unreachable",
+    "no route to host": "unreachable",
+    "host is down": "unreachable",
+    "authentication": "auth",
+    "pairing": "auth",
+    "resource busy": "busy",
+    "device busy": "busy",
+}
+_CONN_ERROR_PATTERN = re.compile(
+    "|".join(map(re.escape, _CONN_ERROR_CATEGORIES)), re.IGNORECASE
+)
+
+# Display name for every possible sensor ID byte; unknown IDs show as hex
+_SENSOR_NAMES = tuple(
+    SENSOR_TYPES[sid].name if sid in SENSOR_TYPES else f"0x{sid:02x}"
+    for sid in range(256)
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class PendingRequest:
     """Represents a pending sensor read request."""
 
     seq_id: int
     sensor_id: int
     future: asyncio.Future
-    timestamp: float
+    timer: asyncio.TimerHandle | None = None  # Expiry timer, cancelled on release
+
+
+class _CBState(IntEnum):
+    """Circuit breaker states."""
+
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
 
 
 class CircuitBreaker:
@@ -45,28 +93,61 @@ class CircuitBreaker:
     - CLOSED: Normal operation, requests allowed
     - OPEN: Too many failures, requests blocked for 60 seconds
     - HALF_OPEN: After timeout, allow one test request
+
+    If a probe callback is given, it is scheduled to run when the open period
+    ends so recovery can be tested in the background, before the next request.
     """
 
-    def __init__(self, failure_threshold: int = 3, open_duration: float = 60.0, max_backoff: float = 3600.0):
+    # Backoff ladders keyed by (open_duration, max_backoff)
+    _BACKOFF_TABLES: dict[tuple[float, float], tuple[float, ...]] = {}
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        open_duration: float = 60.0,
+        max_backoff: float = 3600.0,
+        probe: Callable[[], None] | None = None,
+    ):
         """Initialize circuit breaker.
 
         Args:
             failure_threshold: Number of failures before opening circuit
             open_duration: Base seconds to wait before entering half-open state
             max_backoff: Maximum backoff duration in seconds (default: 1 hour)
+            probe: Called from the event loop when the open period ends
         """
-        self.state = "CLOSED"
+        self.state = _CBState.CLOSED
         self.failure_count = 0
         self.failure_threshold = failure_threshold
-        self.open_time: float | None = None
+        self.open_time: float | None = None  # time.monotonic(), not wall-clock
+        self._open_until = 0.0  # Time at which an OPEN circuit may enter HALF_OPEN
         self.base_open_duration = open_duration
         self.max_backoff = max_backoff
+        # Backoff ladder: base_duration * 2^n, capped; later failures reuse the last step.
+        # Breakers with the same parameters share one table.
+        table_key = (open_duration, max_backoff)
+        table = self._BACKOFF_TABLES.get(table_key)
+        if table is None:
+            table = self._BACKOFF_TABLES[table_key] = tuple(
+                min(open_duration * (1 << i), max_backoff) for i in range(32)
+            )
+        self._backoff_table = table
+        self._probe = probe
+        self._probe_handle: asyncio.TimerHandle | None = None
+
+    def cancel_probe(self) -> None:
+        """Cancel a scheduled background probe, if any."""
+        if self._probe_handle is not None:
+            self._probe_handle.cancel()
+            self._probe_handle = None
 
     def record_success(self) -> None:
         """Record successful operation - reset to CLOSED state."""
         self.failure_count = 0
-        self.state = "CLOSED"
+        self.state = _CBState.CLOSED
         self.open_time = None
+        self._open_until = 0.0
+        self.cancel_probe()
         _LOGGER.debug("[CIRCUIT] ✓ Success recorded, circuit CLOSED")
 
     def record_failure(self) -> None:
@@ -79,13 +160,15 @@ class CircuitBreaker:
         )
 
         if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
-            self.open_time = time.time()
+            self.state = _CBState.OPEN
+            self.open_time = time.monotonic()
 
-            # Calculate exponential backoff: base_duration * 2^(failures - threshold)
+            # Exponential backoff: base_duration * 2^(failures - threshold)
             # Example: 3 failures → 60s, 4 → 120s, 5 → 240s, 6 → 480s, etc.
-            backoff_multiplier = 2 ** (self.failure_count - self.failure_threshold)
-            open_duration = min(self.base_open_duration * backoff_multiplier, self.max_backoff)
+            open_duration = self._backoff_table[
+                min(self.failure_count - self.failure_threshold, 31)
+            ]
+            self._open_until = self.open_time + open_duration
 
             _LOGGER.warning(
                 "[CIRCUIT] Circuit OPEN due to %d consecutive failures. "
@@ -94,41 +177,55 @@ class CircuitBreaker:
                 open_duration
             )
 
+            if self._probe is not None:
+                self.cancel_probe()
+                self._probe_handle = asyncio.get_running_loop().call_later(
+                    open_duration, self._run_probe
+                )
+
+    def _run_probe(self) -> None:
+        """Timer callback: hand off to the probe when the open period ends."""
+        self._probe_handle = None
+        if self._probe is not None and self.state == _CBState.OPEN:
+            self._probe()
+
+    def enter_half_open(self) -> None:
+        """Move an OPEN circuit to HALF_OPEN to test recovery."""
+        # CRITICAL FIX: Reset failure_count when entering HALF_OPEN
+        # This prevents infinite accumulation of failures
+        previous_failures = self.failure_count
+        self.failure_count = 0
+        self.state = _CBState.HALF_OPEN
+        _LOGGER.info(
+            "[CIRCUIT] Circuit entering HALF_OPEN state after %.0f seconds "
+            "(was %d failures, now testing recovery)",
+            time.monotonic() - self.open_time if self.open_time is not None else 0.0,
+            previous_failures
+        )
+
     def can_attempt(self) -> tuple[bool, str]:
         """Check if request can proceed.
 
         Returns:
             Tuple of (can_proceed, reason)
         """
-        if self.state == "CLOSED":
+        if self.state == _CBState.CLOSED:
             return True, "Circuit closed"
 
-        elif self.state == "OPEN":
+        elif self.state == _CBState.OPEN:
             if self.open_time is None:
                 # Shouldn't happen, but handle gracefully
-                self.state = "CLOSED"
+                self.state = _CBState.CLOSED
                 return True, "Circuit reset"
 
-            # Calculate current open duration with exponential backoff
-            backoff_multiplier = 2 ** (self.failure_count - self.failure_threshold)
-            open_duration = min(self.base_open_duration * backoff_multiplier, self.max_backoff)
-
-            elapsed = time.time() - self.open_time
-            if elapsed >= open_duration:
-                # CRITICAL FIX: Reset failure_count when entering HALF_OPEN
-                # This prevents infinite accumulation of failures
-                previous_failures = self.failure_count
-                self.failure_count = 0
-                self.state = "HALF_OPEN"
-                _LOGGER.info(
-                    "[CIRCUIT] Circuit entering HALF_OPEN state after %.0f seconds "
-                    "(was %d failures, now testing recovery)",
-                    elapsed,
-                    previous_failures
-                )
+            # Normally the background probe leaves OPEN first; this is the fallback
+            # when no probe is configured or it has not run yet
+            now = time.monotonic()
+            if now >= self._open_until:
+                self.enter_half_open()
                 return True, "Circuit half-open (testing)"
 
-            remaining = open_duration - elapsed
+            remaining = self._open_until - now
             return False, f"Circuit open ({remaining:.0f}s remaining, {self.failure_count} failures)"
 
         else:  # HALF_OPEN
@@ -136,15 +233,10 @@ class CircuitBreaker:
 
     def get_state_info(self) -> str:
         """Get human-readable state information."""
-        if self.state == "CLOSED":
+        if self.state == _CBState.CLOSED:
             return f"CLOSED (failures: {self.failure_count})"
-        elif self.state == "OPEN" and self.open_time:
-            # Calculate current open duration with exponential backoff
-            backoff_multiplier = 2 ** (self.failure_count - self.failure_threshold)
-            open_duration = min(self.base_open_duration * backoff_multiplier, self.max_backoff)
-
-            elapsed = time.time() - self.open_time
-            remaining = max(0, open_duration - elapsed)
+        elif self.state == _CBState.OPEN and self.open_time:
+            remaining = max(0, self._open_until - time.monotonic())
             return f"OPEN (blocking for {remaining:.0f}s, {self.failure_count} failures)"
         else:
             return f"HALF_OPEN (testing, {self.failure_count} failures)"
@@ -161,17 +253,22 @@ class EM1003Device:
         self._client: BleakClient | None = None
         self.sensor_data: dict[int, float | None] = {}
         self.buzzer_state: bool | None = None  # Buzzer state (True=on, False=off, None=unknown)
+        # All timestamps on this object come from time.monotonic(); they are only
+        # meaningful as deltas and cannot be compared with wall-clock times
         self._last_disconnect_time: float | None = None
 
         # Request cache for matching responses to requests
         # Key: (seq_id, sensor_id), Value: PendingRequest
         self._pending_requests: dict[tuple[int, int], PendingRequest] = {}
-        self._used_seq_ids: set[int] = set()  # Track used sequence IDs
+        # Pre-shuffled free list of sequence IDs; allocation pops from the front,
+        # released IDs go to the back so recently used IDs are not reused immediately
+        self._free_seq_ids: deque[int] = deque(random.sample(range(256), 256))
 
         # Circuit breaker to prevent request pile-up
         self._circuit_breaker = CircuitBreaker(
             failure_threshold=3,
-            open_duration=60.0
+            open_duration=60.0,
+            probe=self._start_probe,
         )
 
         # Connection abort tracking for adaptive backoff
@@ -179,72 +276,190 @@ class EM1003Device:
         self._last_connection_abort_time: float | None = None
 
         # Track last connection failure for fast-fail behavior
-        self._last_connection_failure_time: float | None = None
+        # Cleared on connection failure and set again by a timer after the window
+        self._connect_allowed = asyncio.Event()
+        self._connect_allowed.set()
+        self._fast_fail_handle: asyncio.TimerHandle | None = None
         self._fast_fail_window = 30.0  # Seconds to fast-fail after connection failure
 
+        # Delay between back-to-back sensor read requests in read_all_sensors;
+        # grows after timeouts or BLE errors and shrinks again on clean polls
+        self._pacing_delay = 0.05
+
+        # Scratch buffer for sensor read requests: [seq_id][CMD_READ_SENSOR][sensor_id]
+        self._req_buf = bytearray((0, CMD_READ_SENSOR, 0))
+
+        # Consecutive polls rejected by the circuit breaker
+        self._blocked_polls = 0
+
+        # Last time a full traceback was logged for an unexpected request error
+        self._last_traceback_time: float | None = None
+
+        # Post-read disconnect running in the background
+        self._disconnect_task: asyncio.Task | None = None
+
+        # Background recovery probe, and the number of requests it must not overlap
+        self._probe_task: asyncio.Task | None = None
+        self._active_operations = 0
+
+    def _start_probe(self) -> None:
+        """Start a background recovery probe when the circuit's open period ends."""
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = self.hass.async_create_task(self._probe_connection())
+
+    async def _probe_connection(self) -> None:
+        """Test recovery with a connect/disconnect cycle outside the polling path.
+
+        On success the circuit closes before the next poll arrives; on failure
+        the circuit stays HALF_OPEN and polls test recovery as before.
+        """
+        if self._circuit_breaker.state != _CBState.OPEN:
+            return
+
+        # A request still in flight owns the connection; the next poll tests
+        # recovery itself once the open period has elapsed
+        if self._active_operations:
+            _LOGGER.debug("[CIRCUIT] Skipping background probe, a request is in flight")
+            return
+
+        self._circuit_breaker.enter_half_open()
+        _LOGGER.debug("[CIRCUIT] Probing connection to %s in background", self._device_id())
+
+        try:
+            await self._ensure_connected()
+        except Exception as err:
+            _LOGGER.info("[CIRCUIT] Background probe to %s failed: %s", self._device_id(), err)
+            self._circuit_breaker.record_failure()
+            return
+
+        self._circuit_breaker.record_success()
+        _LOGGER.info("[CIRCUIT] ✓ Background probe to %s succeeded", self._device_id())
+        await self.disconnect()
+
+    async def async_shutdown(self) -> None:
+        """Stop background work and release the connection."""
+        self._circuit_breaker.cancel_probe()
+        self._cancel_fast_fail()
+        probe_task = self._probe_task
+        if probe_task is not None and not probe_task.done():
+            probe_task.cancel()
+            await asyncio.wait((probe_task,))
+        await self._wait_for_disconnect()
+        await self.disconnect()
+
+    async def _safe_disconnect(self) -> None:
+        """Disconnect in the background after a poll, logging any error."""
+        try:
+            await self.disconnect()
+        except Exception as disconnect_err:
+            _LOGGER.debug(
+                "[CONN] Error during post-read disconnect: %s",
+                disconnect_err
+            )
+
+    async def _wait_for_disconnect(self) -> None:
+        """Wait for a background post-read disconnect to finish, if one is running."""
+        task = self._disconnect_task
+        if task is not None and not task.done():
+            # Shield so a cancelled caller does not abort the teardown itself
+            await asyncio.shield(task)
+
+    async def _wait_for_probe(self) -> None:
+        """Wait for a running background probe so requests never share its connection."""
+        task = self._probe_task
+        if task is not None and not task.done():
+            # The probe handles its own errors; only its completion matters here
+            await asyncio.wait((task,))
+
     def _device_id(self) -> str:
         """Get device identifier for logging."""
         if self.device_name and self.device_name != self.mac_address:
             return f"{self.device_name} ({self.mac_address})"
         return self.mac_address
 
+    def _log_unexpected_error(self, msg: str, *args) -> None:
+        """Log an unexpected error from an except block.
+
+        The full traceback is included at most once per minute so that error
+        storms during BLE outages do not format a stack trace for every request.
+        """
+        now = time.monotonic()
+        if self._last_traceback_time is None or now - self._last_traceback_time >= 60:
+            self._last_traceback_time = now
+            _LOGGER.error(msg, *args, exc_info=True)
+        else:
+            _LOGGER.error(msg, *args)
+
     def _get_random_sequence_id(self) -> int:
         """Get a random unused sequence ID.
 
         Uses random IDs to avoid collisions when multiple requests are in flight.
-        Cache is limited to 256 entries (max possible sequence IDs).
+        IDs are taken from a pre-shuffled free list, so allocation is O(1).
         """
-        # Clean up old sequence IDs if cache is getting full
-        if len(self._used_seq_ids) >= 250:
-            _LOGGER.debug(
-                "[SEQ] Cache nearly full (%d), clearing old sequence IDs",
-                len(self._used_seq_ids)
-            )
-            self._used_seq_ids.clear()
-
-        # Try to find an unused random sequence ID
-        for attempt in range(100):
-            seq_id = random.randint(0, 255)
-            if seq_id not in self._used_seq_ids:
-                self._used_seq_ids.add(seq_id)
-                return seq_id
-
-        # Fallback: sequential search
-        for seq_id in range(256):
-            if seq_id not in self._used_seq_ids:
-                self._used_seq_ids.add(seq_id)
-                _LOGGER.debug("[SEQ] Used sequential fallback, seq_id=%02x", seq_id)
-                return seq_id
-
-        # Last resort: clear and start over
-        _LOGGER.warning("[SEQ] All 256 sequence IDs exhausted, clearing cache")
-        self._used_seq_ids.clear()
-        seq_id = random.randint(0, 255)
-        self._used_seq_ids.add(seq_id)
-        return seq_id
-
-    def _cleanup_expired_requests(self, max_age: float = 10.0) -> None:
-        """Clean up expired pending requests.
+        if not self._free_seq_ids:
+            # Rebuild from IDs not held by a pending request (recovers any leaked IDs)
+            in_use = {seq_id for seq_id, _ in self._pending_requests}
+            free_ids = [seq_id for seq_id in range(256) if seq_id not in in_use]
+            if not free_ids:
+                _LOGGER.warning("[SEQ] All 256 sequence IDs exhausted, reusing IDs")
+                free_ids = list(range(256))
+            random.shuffle(free_ids)
+            self._free_seq_ids.extend(free_ids)
+
+        return self._free_seq_ids.popleft()
+
+    def _sensor_request(self, seq_id: int, sensor_id: int) -> bytes:
+        """Build a sensor read request in the reusable buffer."""
+        buf = self._req_buf
+        buf[0] = seq_id
+        buf[2] = sensor_id
+        return bytes(buf)
+
+    def _release_request(self, request_key: tuple[int, int]) -> PendingRequest | None:
+        """Remove a pending request and return its sequence ID to the free list.
+
+        Safe to call more than once for the same key; the ID is only released once.
+        """
+        pending_request = self._pending_requests.pop(request_key, None)
+        if pending_request is not None:
+            if pending_request.timer is not None:
+                pending_request.timer.cancel()
+            self._free_seq_ids.append(request_key[0])
+        return pending_request
+
+    def _register_request(
+        self, seq_id: int, sensor_id: int, max_age: float = 10.0
+    ) -> PendingRequest:
+        """Register a pending request and schedule its expiry.
 
         Args:
-            max_age: Maximum age in seconds for a pending request
+            seq_id: Sequence ID of the request
+            sensor_id: Sensor ID (or buzzer placeholder) the response will carry
+            max_age: Seconds before the request is expired if no response arrives
         """
-        now = time.time()
-        expired_keys = [
-            key for key, req in self._pending_requests.items()
-            if now - req.timestamp > max_age
-        ]
-
-        for key in expired_keys:
-            seq_id, sensor_id = key
-            req = self._pending_requests.pop(key)
-            self._used_seq_ids.discard(seq_id)
-            if not req.future.done():
-                req.future.cancel()
-            _LOGGER.debug(
-                "[CACHE] Cleaned up expired request: seq=%02x, sensor=%02x (age=%.1fs)",
-                seq_id, sensor_id, now - req.timestamp
-            )
+        request_key = (seq_id, sensor_id)
+        pending_request = PendingRequest(
+            seq_id=seq_id,
+            sensor_id=sensor_id,
+            future=self.hass.loop.create_future(),
+        )
+        pending_request.timer = self.hass.loop.call_later(
+            max_age, self._expire_request, request_key
+        )
+        self._pending_requests[request_key] = pending_request
+        return pending_request
+
+    def _expire_request(self, request_key: tuple[int, int]) -> None:
+        """Expire a pending request that never received a response."""
+        req = self._release_request(request_key)
+        if req is None:
+            return
+        if not req.future.done():
+            req.future.cancel()
+        _LOGGER.debug(
+            "[CACHE] Cleaned up expired request: seq=%02x, sensor=%02x",
+            req.seq_id, req.sensor_id
+        )
 
     async def _ensure_connection_delay(self) -> None:
         """Ensure sufficient delay since last disconnect to avoid connection issues.
@@ -254,7 +469,7 @@ class EM1003Device:
         - After connection abort: adds exponential backoff
         - Resets abort count after 5 minutes of no abort errors
         """
-        current_time = time.time()
+        current_time = time.monotonic()
 
         # Reset connection abort counter if it's been a while since last abort
         if self._last_connection_abort_time is not None:
@@ -326,11 +541,13 @@ class EM1003Device:
                 "Make sure device is powered on and nearby."
             )
 
+        # Read device attributes once; they are reused by the failure diagnostics
         device_rssi = getattr(device, 'rssi', None)
+        device_name = device.name or "Unknown"
         _LOGGER.info(
             "[DIAG] ✓ Found device %s (Name: %s, RSSI: %s dBm)",
             self.mac_address,
-            device.name or "Unknown",
+            device_name,
             device_rssi if device_rssi is not None else "N/A"
         )
 
@@ -343,24 +560,28 @@ class EM1003Device:
             self.mac_address
         )
 
-        connection_start_time = time.time()
+        connection_start_time = time.monotonic()
         client = None
         try:
             _LOGGER.info(
                 "[CONN_ROOT_CAUSE] Starting connection attempt to %s (RSSI: %s)",
-                self.mac_address, getattr(device, 'rssi', 'N/A')
+                self.mac_address, device_rssi if device_rssi is not None else "N/A"
             )
 
+            # BleakClientWithServiceCache reuses the cached GATT database across
+            # reconnects, and the services filter limits discovery to the one
+            # service we talk to (write 0xFFF1 / notify 0xFFF4)
             client = await establish_connection(
-                BleakClient,
+                BleakClientWithServiceCache,
                 device,
                 self.mac_address,
-                disconnected_callback=lambda _: None,
+                disconnected_callback=self._handle_disconnect,
                 max_attempts=1,  # CRITICAL: Reduced to 1 to prevent slot exhaustion
-                timeout=30.0,  # 30 second timeout per attempt
+                timeout=TIMEOUT_CONNECT,
+                services=[EM1003_SERVICE_UUID],
             )
 
-            connection_duration = time.time() - connection_start_time
+            connection_duration = time.monotonic() - connection_start_time
             _LOGGER.info(
                 "[CONN_ROOT_CAUSE] ✓ Connection successful to %s (took %.2fs)",
                 self.mac_address, connection_duration
@@ -388,35 +609,23 @@ class EM1003Device:
                         "[CONN_ROOT_CAUSE] Error during connection cleanup: %s",
                         cleanup_err
                     )
-            connection_duration = time.time() - connection_start_time
+            # One clock read serves both the duration and the abort timestamp
+            failed_at = time.monotonic()
+            connection_duration = failed_at - connection_start_time
 
-            # Analyze the error to determine root cause
-            error_message = str(conn_err).lower()
+            # Analyze the error to determine root cause (single scan of the message)
             error_type = type(conn_err).__name__
+            categories = {
+                _CONN_ERROR_CATEGORIES[match.lower()]
+                for match in _CONN_ERROR_PATTERN.findall(str(conn_err))
+            }
 
             # Categorize the error
-            is_connection_abort = (
-                "connection abort" in error_message or
-                "software caused connection abort" in error_message
-            )
-            is_timeout = "timeout" in error_message or isinstance(conn_err, asyncio.TimeoutError)
-            is_device_unreachable = (
-                "device unreachable" in error_message or
-                "no route to host" in error_message or
-                "host is down" in error_message
-            )
-            is_auth_failed = (
-                "authentication" in error_message or
-                "pairing" in error_message
-            )
-            is_resource_busy = (
-                "resource busy" in error_message or
-                "device busy" in error_message
-            )
-
-            # Build diagnostic context
-            device_rssi = getattr(device, 'rssi', None)
-            device_name = getattr(device, 'name', 'Unknown')
+            is_connection_abort = "abort" in categories
+            is_timeout = "timeout" in categories or isinstance(conn_err, asyncio.TimeoutError)
+            is_device_unreachable = "unreachable" in categories
+            is_auth_failed = "auth" in categories
+            is_resource_busy = "busy" in categories
 
             # Log detailed root cause analysis
             _LOGGER.error(
@@ -437,7 +646,7 @@ class EM1003Device:
             # Determine and log the root cause
             if is_connection_abort:
                 self._connection_abort_count += 1
-                self._last_connection_abort_time = time.time()
+                self._last_connection_abort_time = failed_at
                 _LOGGER.error(
                     "[CONN_ROOT_CAUSE] Root cause: CONNECTION ABORT - "
                     "Bluetooth stack aborted connection (count: %d). "
@@ -447,10 +656,10 @@ class EM1003Device:
             elif is_timeout:
                 _LOGGER.error(
                     "[CONN_ROOT_CAUSE] Root cause: TIMEOUT - "
-                    "Device did not respond within 30s. "
+                    "Device did not respond within %.0fs. "
                     "Possible reasons: device out of range (RSSI: %s), device sleeping, "
                     "or device not advertising",
-                    device_rssi
+                    TIMEOUT_CONNECT, device_rssi
                 )
             elif is_device_unreachable:
                 _LOGGER.error(
@@ -530,6 +739,9 @@ class EM1003Device:
         Raises:
             BleakError: If connection fails or fast-fail is active
         """
+        # A client still being torn down after the last poll must not be reused
+        await self._wait_for_disconnect()
+
         # PRIORITY 1: Check if we already have a valid connection
         if self._client and self._client.is_connected:
             _LOGGER.info(
@@ -544,21 +756,19 @@ class EM1003Device:
         )
 
         # Fast-fail if we recently failed to connect (unless circuit breaker is testing)
-        if self._last_connection_failure_time is not None:
-            time_since_failure = time.time() - self._last_connection_failure_time
-
-            # Only fast-fail if we're not in HALF_OPEN state (testing phase)
-            if time_since_failure < self._fast_fail_window and self._circuit_breaker.state != "HALF_OPEN":
-                remaining = self._fast_fail_window - time_since_failure
-                _LOGGER.debug(
-                    "[CONN] Fast-fail: Recent connection failure (%.0fs ago), "
-                    "skipping connection attempt for %.0fs more",
-                    time_since_failure, remaining
-                )
-                raise BleakError(
-                    f"Fast-fail: Connection failed {time_since_failure:.0f}s ago, "
-                    f"will retry after {remaining:.0f}s"
-                )
+        if not self._connect_allowed.is_set() and self._circuit_breaker.state != _CBState.HALF_OPEN:
+            remaining = (
+                self._fast_fail_handle.when() - self.hass.loop.time()
+                if self._fast_fail_handle is not None else 0.0
+            )
+            _LOGGER.debug(
+                "[CONN] Fast-fail: Recent connection failure, "
+                "skipping connection attempt for %.0fs more",
+                remaining
+            )
+            raise BleakError(
+                f"Fast-fail: Recent connection failure, will retry after {remaining:.0f}s"
+            )
 
         # PRIORITY 2: Need to establish a new connection via active BLE scanning
         _LOGGER.info(
@@ -574,8 +784,8 @@ class EM1003Device:
                 await self._client.start_notify(EM1003_NOTIFY_CHAR_UUID, self._notification_handler)
                 _LOGGER.debug("[CONN] ✓ Connected and subscribed to %s", self.mac_address)
 
-                # Connection successful - clear failure timestamp
-                self._last_connection_failure_time = None
+                # Connection successful - lift any fast-fail window
+                self._cancel_fast_fail()
 
             except Exception as err:
                 # Failed to subscribe, disconnect and re-raise
@@ -588,15 +798,14 @@ class EM1003Device:
                     except Exception as disconnect_err:
                         _LOGGER.debug("[CONN] Error during cleanup disconnect: %s", disconnect_err)
                 self._client = None
-                # Record failure timestamp
-                self._last_connection_failure_time = time.time()
+                # Fast-fail window is started once by the outer handler
                 raise
 
             return self._client
 
         except Exception as err:
-            # Record failure timestamp for fast-fail
-            self._last_connection_failure_time = time.time()
+            # Block new connection attempts for the fast-fail window
+            self._start_fast_fail()
             # CRITICAL: Ensure client is cleared so it doesn't hold a stale connection
             if self._client is not None:
                 try:
@@ -607,6 +816,32 @@ class EM1003Device:
                 self._client = None
             raise
 
+    def _start_fast_fail(self) -> None:
+        """Block connection attempts until the fast-fail window expires."""
+        self._cancel_fast_fail()
+        self._connect_allowed.clear()
+        self._fast_fail_handle = self.hass.loop.call_later(
+            self._fast_fail_window, self._connect_allowed.set
+        )
+
+    def _cancel_fast_fail(self) -> None:
+        """End any active fast-fail window immediately."""
+        if self._fast_fail_handle is not None:
+            self._fast_fail_handle.cancel()
+            self._fast_fail_handle = None
+        self._connect_allowed.set()
+
+    def note_disconnect(self) -> None:
+        """Record a disconnect made by another client for the same device.
+
+        The next connection attempt then honours the usual settle delay.
+        """
+        self._last_disconnect_time = time.monotonic()
+
+    def _handle_disconnect(self, _client: BleakClient) -> None:
+        """Record the time of any disconnect, including ones the device initiates."""
+        self._last_disconnect_time = time.monotonic()
+
     async def disconnect(self) -> None:
         """Explicitly disconnect from the device."""
         if self._client and self._client.is_connected:
@@ -625,11 +860,39 @@ class EM1003Device:
                 _LOGGER.debug("[CONN] Error during disconnect: %s", err)
             finally:
                 self._client = None
-                self._last_disconnect_time = time.time()
+                self._last_disconnect_time = time.monotonic()
         else:
             _LOGGER.debug("[CONN] Already disconnected from %s", self.mac_address)
             self._client = None
 
+    def _complete_request(
+        self, request_key: tuple[int, int], data: bytearray, label: str
+    ) -> bool:
+        """Resolve the pending request matching a response.
+
+        Returns False (after logging) when no request is waiting for this key.
+        The future's callbacks only run on the next loop iteration, so callers
+        can still parse the payload into instance state after this returns.
+        """
+        pending_request = self._release_request(request_key)
+        if pending_request is None:
+            _LOGGER.warning(
+                "[RX] ✗ %s: Unexpected response (seq=0x%02x, sensor_id=0x%02x, no matching request)",
+                label, request_key[0], request_key[1]
+            )
+            return False
+
+        if not pending_request.future.done():
+            pending_request.future.set_result(data)
+
+        _LOGGER.debug(
+            "[CACHE] Removed completed request (seq=%02x, sensor=%02x). "
+            "Pending: %d, Free seq_ids: %d",
+            request_key[0], request_key[1],
+            len(self._pending_requests), len(self._free_seq_ids)
+        )
+        return True
+
     def _notification_handler(self, sender, data: bytearray) -> None:
         """Handle notification from device.
 
@@ -644,63 +907,40 @@ class EM1003Device:
             seq_id = data[0]
             cmd_type = data[1]
             sensor_id = data[2]
-            value_bytes = data[3:]
+
+            # Packet hex dumps are only built when debug logging is on
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
             # Handle buzzer set response (0x05)
             if cmd_type == CMD_BUZZER_SET_RESPONSE:
-                hex_parts = ' '.join([f'{b:02x}' for b in data])
-                _LOGGER.debug(
-                    "[RX] (蜂鸣器设置响应)[0x %s] len=%d",
-                    hex_parts, len(data)
-                )
-
-                # Find matching pending request
-                # For set operations, we use sensor_id 0x01
-                request_key = (seq_id, 0x01)
-                pending_request = self._pending_requests.get(request_key)
-
-                if not pending_request:
-                    _LOGGER.warning(
-                        "[RX] ✗ Buzzer set: Unexpected response (seq=0x%02x, no matching request)",
-                        seq_id
+                if debug:
+                    hex_parts = data.hex(' ')
+                    _LOGGER.debug(
+                        "[RX] (蜂鸣器设置响应)[0x %s] len=%d",
+                        hex_parts, len(data)
                     )
-                    return
 
-                _LOGGER.info(
-                    "[RESP] ✓ Buzzer set command acknowledged"
-                )
-
-                # Complete the future
-                if not pending_request.future.done():
-                    pending_request.future.set_result(data)
-
-                del self._pending_requests[request_key]
-                self._used_seq_ids.discard(seq_id)
+                # For set operations, we use sensor_id 0x01
+                if self._complete_request((seq_id, 0x01), data, "Buzzer set"):
+                    _LOGGER.info("[RESP] ✓ Buzzer set command acknowledged")
                 return
 
             # Handle buzzer query response (0x50)
             if cmd_type == CMD_BUZZER:
-                hex_parts = ' '.join([f'{b:02x}' for b in data])
-                _LOGGER.debug(
-                    "[RX] (蜂鸣器响应)[0x %s] len=%d, sensor_id=0x%02x, value_bytes=%s",
-                    hex_parts, len(data), sensor_id, value_bytes.hex() if value_bytes else "empty"
-                )
-
-                # Find matching pending request
-                request_key = (seq_id, sensor_id)
-                pending_request = self._pending_requests.get(request_key)
-
-                if not pending_request:
-                    _LOGGER.warning(
-                        "[RX] ✗ Buzzer: Unexpected response (seq=0x%02x, sensor_id=0x%02x, no matching request)",
-                        seq_id, sensor_id
+                if debug:
+                    hex_parts = data.hex(' ')
+                    _LOGGER.debug(
+                        "[RX] (蜂鸣器响应)[0x %s] len=%d, sensor_id=0x%02x, value_bytes=%s",
+                        hex_parts, len(data), sensor_id, data[3:].hex() or "empty"
                     )
+
+                if not self._complete_request((seq_id, sensor_id), data, "Buzzer"):
                     return
 
                 # Parse buzzer state from response
                 # Response format: [seq_id][0x50][0x00][state]
-                if len(value_bytes) >= 1:
-                    buzzer_value = value_bytes[0]
+                if len(data) >= 4:
+                    buzzer_value = data[3]
                     self.buzzer_state = (buzzer_value == BUZZER_ON)
                     _LOGGER.info(
                         "[RESP] ✓ Buzzer state = %s (0x%02x)",
@@ -712,89 +952,56 @@ class EM1003Device:
                         "[RX] ✗ Buzzer: Response too short (len=%d, expected >= 4 bytes)",
                         len(data)
                     )
-
-                # Complete the future
-                if not pending_request.future.done():
-                    pending_request.future.set_result(data)
-
-                del self._pending_requests[request_key]
-                self._used_seq_ids.discard(seq_id)
                 return
 
             # Get sensor name for logging
-            sensor_info = SENSOR_TYPES.get(sensor_id, {})
-            sensor_name = sensor_info.get("name", f"0x{sensor_id:02x}")
+            sensor_info = SENSOR_TYPES.get(sensor_id)
+            sensor_name = _SENSOR_NAMES[sensor_id]
 
             # Format: (设备响应)[0x seq-cmd-sensor-value...] 实体XX 传感器名
-            hex_parts = ' '.join([f'{b:02x}' for b in data])
-            _LOGGER.debug(
-                "[RX] (设备响应)[0x %s] 实体%02x %s",
-                hex_parts, sensor_id, sensor_name
-            )
-
-
-            # Find matching pending request using (seq_id, sensor_id) key
-            request_key = (seq_id, sensor_id)
-            pending_request = self._pending_requests.get(request_key)
-
-            if not pending_request:
-                _LOGGER.warning(
-                    "[RX] ✗ %s: Unexpected response (seq=0x%02x, no matching request)",
-                    sensor_name, seq_id
+            if debug:
+                hex_parts = data.hex(' ')
+                _LOGGER.debug(
+                    "[RX] (设备响应)[0x %s] 实体%02x %s",
+                    hex_parts, sensor_id, sensor_name
                 )
+
+            if not self._complete_request((seq_id, sensor_id), data, sensor_name):
                 return
 
             # Parse value based on sensor type
             # Value is in little-endian format (e.g., 0x31 0x00 = 49)
-            if len(value_bytes) >= 2:
-                raw_value = int.from_bytes(value_bytes[:2], byteorder='little')
+            if len(data) >= 5:
+                (raw_value,) = _U16LE_UNPACK(data, 3)
 
                 # Apply sensor-specific scaling and offsets
-                formula_desc = ""
-                calculated_value = None
-
-                if sensor_id == 0x01:
-                    # Temperature: (raw - 4000) / 100
-                    calculated_value = (raw_value - 4000) / 100.0
-                    formula_desc = f"({raw_value} - 4000) / 100"
-                elif sensor_id == 0x06:
-                    # Humidity: raw / 100
-                    calculated_value = raw_value / 100.0
-                    formula_desc = f"{raw_value} / 100"
-                elif sensor_id == 0x0A:
-                    # Formaldehyde: (raw - 16384) / 1000
-                    calculated_value = (raw_value - 16384) / 1000.0
-                    formula_desc = f"({raw_value} - 16384) / 1000"
-                elif sensor_id in [0x08, 0x09, 0x11, 0x12, 0x13]:
-                    # Noise, PM2.5, PM10, TVOC, eCO2: raw value directly
-                    calculated_value = raw_value
-                    formula_desc = f"{raw_value} (direct)"
-                else:
-                    # Other sensors use raw value directly (Noise, etc.)
-                    calculated_value = raw_value
-                    formula_desc = f"{raw_value} (direct)"
-
-                # Filter out negative values for specific sensors
-                # Skip data if negative for: Humidity, Noise, PM2.5, Formaldehyde, PM10, TVOC, eCO2
-                if sensor_id in [0x06, 0x08, 0x09, 0x0A, 0x11, 0x12, 0x13] and calculated_value < 0:
+                # Integer math up to the single final division; unscaled sensors stay int
+                offset = SENSOR_OFFSET[sensor_id]
+                divisor = SENSOR_DIVISOR[sensor_id]
+                scaled = raw_value - offset
+                calculated_value = scaled / divisor if divisor != 1 else scaled
+
+                # Filter out negative values for sensors that cannot legitimately be negative
+                if calculated_value < 0 and sensor_id in NON_NEGATIVE_SENSOR_IDS:
                     _LOGGER.warning(
-                        "[FILTER] ✗ %s (0x%02x): Skipping negative value %s (formula: %s)",
-                        sensor_name, sensor_id, calculated_value, formula_desc
+                        "[FILTER] ✗ %s (0x%02x): Skipping negative value %s (formula: (%d - %d) / %d)",
+                        sensor_name, sensor_id, calculated_value, raw_value, offset, divisor
                     )
                     # Don't update sensor_data, effectively skipping this reading
                 else:
                     # Only store valid (non-negative) values
                     self.sensor_data[sensor_id] = calculated_value
 
-                unit = sensor_info.get("unit", "")
+                unit = (sensor_info.unit if sensor_info else None) or ""
                 final_value = self.sensor_data.get(sensor_id)
 
                 # Format: 解析: 字节XX → 原始值N → 公式[...] → 最终值V 单位
-                value_hex = ' '.join([f'{b:02x}' for b in value_bytes[:2]])
-                _LOGGER.debug(
-                    "[RX] 解析: 字节[%s] → 原始值%d → 公式[%s] → 最终值%s %s",
-                    value_hex, raw_value, formula_desc, final_value, unit
-                )
+                if debug:
+                    value_hex = data[3:5].hex(' ')
+                    _LOGGER.debug(
+                        "[RX] 解析: 字节[%s] → 原始值%d → 公式[(%d - %d) / %d] → 最终值%s %s",
+                        value_hex, raw_value, raw_value, offset, divisor, final_value, unit
+                    )
 
                 _LOGGER.info(
                     "[RESP] ✓ %s (0x%02x) = %s %s",
@@ -803,23 +1010,38 @@ class EM1003Device:
             else:
                 _LOGGER.warning(
                     "[RX] ✗ %s: Value too short (got %d bytes, need at least 2)",
-                    sensor_name, len(value_bytes)
+                    sensor_name, len(data) - 3
                 )
 
-            # Complete the future and remove from pending requests
-            if not pending_request.future.done():
-                pending_request.future.set_result(data)
+        except Exception as err:
+            self._log_unexpected_error("Error handling notification: %s", err)
 
-            del self._pending_requests[request_key]
-            self._used_seq_ids.discard(seq_id)
-            _LOGGER.debug(
-                "[CACHE] Removed completed request (seq=%02x, sensor=%02x). "
-                "Pending: %d, Used seq_ids: %d",
-                seq_id, sensor_id, len(self._pending_requests), len(self._used_seq_ids)
-            )
+    async def _send_and_wait(
+        self, client: BleakClient, seq_id: int, sensor_id: int, request: bytes
+    ) -> bool:
+        """Send a request and wait for the matching response.
 
-        except Exception as err:
-            _LOGGER.error("Error handling notification: %s", err, exc_info=True)
+        Args:
+            client: Connected client to write to
+            seq_id: Sequence ID carried in the request
+            sensor_id: Sensor ID (or buzzer placeholder) the response will carry
+            request: Complete request frame
+
+        Returns:
+            True once the response has been handled, False on timeout.
+            BLE errors propagate; the pending request is released either way.
+        """
+        request_key = (seq_id, sensor_id)
+        pending_request = self._register_request(seq_id, sensor_id)
+        try:
+            await client.write_gatt_char(EM1003_WRITE_CHAR_UUID, request, response=False)
+            async with asyncio.timeout(TIMEOUT_RESPONSE):
+                await pending_request.future
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._release_request(request_key)
 
     async def read_sensor(self, sensor_id: int) -> float | None:
         """Read a specific sensor value.
@@ -839,57 +1061,36 @@ class EM1003Device:
             )
             return None
 
-        # Clean up expired requests
-        self._cleanup_expired_requests()
-
+        # Counted as in flight so a background probe never overlaps this request
+        self._active_operations += 1
         try:
+            await self._wait_for_probe()
+
             # Ensure connection (will reuse existing or create new)
             client = await self._ensure_connected()
 
             # Prepare request with random sequence ID
             seq_id = self._get_random_sequence_id()
-            request = bytes([seq_id, CMD_READ_SENSOR, sensor_id])
-
-            # Get sensor name for logging
-            sensor_info = SENSOR_TYPES.get(sensor_id, {})
-            sensor_name = sensor_info.get("name", f"0x{sensor_id:02x}")
+            request = self._sensor_request(seq_id, sensor_id)
 
             # Format: (请求传感器数据)[0x seq-cmd-sensor] 实体XX 传感器名
-            hex_parts = ' '.join([f'{b:02x}' for b in request])
-            _LOGGER.debug(
-                "[TX] (请求传感器数据)[0x %s] 实体%02x %s",
-                hex_parts, sensor_id, sensor_name
-            )
-
-            # Create pending request and add to cache
-            pending_request = PendingRequest(
-                seq_id=seq_id,
-                sensor_id=sensor_id,
-                future=asyncio.Future(),
-                timestamp=time.time()
-            )
-            request_key = (seq_id, sensor_id)
-            self._pending_requests[request_key] = pending_request
-
-            # Send request
-            await client.write_gatt_char(EM1003_WRITE_CHAR_UUID, request, response=False)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[TX] (请求传感器数据)[0x %s] 实体%02x %s",
+                    request.hex(' '), sensor_id, _SENSOR_NAMES[sensor_id]
+                )
 
-            # Wait for response with timeout
-            try:
-                await asyncio.wait_for(pending_request.future, timeout=2.0)
+            if await self._send_and_wait(client, seq_id, sensor_id, request):
                 value = self.sensor_data.get(sensor_id)
                 self._circuit_breaker.record_success()
                 return value
-            except asyncio.TimeoutError:
-                _LOGGER.warning(
-                    "Timeout waiting for sensor 0x%02x response (seq=%02x)",
-                    sensor_id, seq_id
-                )
-                # Clean up pending request
-                self._pending_requests.pop(request_key, None)
-                self._used_seq_ids.discard(seq_id)
-                self._circuit_breaker.record_failure()
-                return None
+
+            _LOGGER.warning(
+                "Timeout waiting for sensor 0x%02x response (seq=%02x)",
+                sensor_id, seq_id
+            )
+            self._circuit_breaker.record_failure()
+            return None
 
         except BleakError as err:
             _LOGGER.error("Bleak error reading sensor %02x: %s", sensor_id, err)
@@ -898,11 +1099,13 @@ class EM1003Device:
             self._client = None
             return None
         except Exception as err:
-            _LOGGER.error("Error reading sensor %02x: %s", sensor_id, err, exc_info=True)
+            self._log_unexpected_error("Error reading sensor %02x: %s", sensor_id, err)
             self._circuit_breaker.record_failure()
             # Clear client so next attempt will create new connection
             self._client = None
             return None
+        finally:
+            self._active_operations -= 1
 
     async def read_all_sensors(self) -> dict[int, float | None]:
         """Read all sensors using persistent connection.
@@ -910,6 +1113,8 @@ class EM1003Device:
         Uses circuit breaker pattern to prevent request pile-up during failures.
         Uses request cache to match responses to requests by (seq_id, sensor_id).
         Maintains a persistent BLE connection that is reused across multiple reads.
+        All requests are sent first and their responses awaited together.
+        The buzzer state is queried on the same connection before it is closed.
 
         Returns:
             Dictionary mapping sensor IDs to their values
@@ -920,24 +1125,32 @@ class EM1003Device:
         # Check circuit breaker before attempting connection
         can_attempt, reason = self._circuit_breaker.can_attempt()
         if not can_attempt:
-            _LOGGER.warning(
-                "[CIRCUIT] Blocked read_all_sensors: %s. State: %s",
+            # Warn on blocked polls 1, 2, 4, 8, ... so long outages log O(log n) lines
+            self._blocked_polls += 1
+            blocked = self._blocked_polls
+            if blocked & (blocked - 1) == 0:
+                _LOGGER.warning(
+                    "[CIRCUIT] Blocked read_all_sensors (%d consecutive): %s. State: %s",
+                    blocked,
+                    reason,
+                    self._circuit_breaker.get_state_info()
+                )
+            # Return None for all sensors when circuit is open
+            return dict.fromkeys(SENSOR_IDS)
+        self._blocked_polls = 0
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[CIRCUIT] Attempt allowed: %s. State: %s",
                 reason,
                 self._circuit_breaker.get_state_info()
             )
-            # Return None for all sensors when circuit is open
-            return {sensor_id: None for sensor_id in SENSOR_TYPES.keys()}
-
-        _LOGGER.debug(
-            "[CIRCUIT] Attempt allowed: %s. State: %s",
-            reason,
-            self._circuit_breaker.get_state_info()
-        )
-
-        # Clean up any expired requests before starting
-        self._cleanup_expired_requests()
 
+        # Counted as in flight so a background probe never overlaps this request
+        self._active_operations += 1
         try:
+            await self._wait_for_probe()
+
             # Ensure connection (will reuse existing or create new)
             _LOGGER.debug("[CONN] Ensuring connection to %s", self.mac_address)
             client = await self._ensure_connected()
@@ -948,100 +1161,57 @@ class EM1003Device:
             )
 
             # Read all sensors using the persistent connection
-            sensor_count = len(SENSOR_TYPES)
-            _LOGGER.debug(
-                "[DIAG] Reading %d sensors: %s",
-                sensor_count,
-                [f"0x{sid:02x}" for sid in SENSOR_TYPES.keys()]
-            )
-
-            for idx, sensor_id in enumerate(SENSOR_TYPES.keys(), 1):
-                # Check if connection is still valid before each read
-                if not client.is_connected:
-                    _LOGGER.warning(
-                        "[REQ] [%d/%d] Connection lost, aborting remaining sensor reads",
-                        idx, sensor_count
-                    )
-                    # Mark remaining sensors as None
-                    for remaining_id in list(SENSOR_TYPES.keys())[idx-1:]:
-                        results[remaining_id] = None
-                    break
+            sensor_count = len(SENSOR_IDS)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[DIAG] Reading %d sensors: %s",
+                    sensor_count,
+                    [f"0x{sid:02x}" for sid in SENSOR_IDS]
+                )
 
+            # Phase 1: send every request back-to-back; responses are matched by
+            # (seq_id, sensor_id) so they can all be outstanding at once
+            sent: list[tuple[int, int, PendingRequest]] = []
+            slow_down = False
+            # No is_connected check before each write: it can cost a D-Bus round-trip
+            # on BlueZ, and a write on a dropped link fails fast with BleakError,
+            # which is where a lost connection is detected below
+            for idx, sensor_id in enumerate(SENSOR_IDS, 1):
                 try:
                     # Get random sequence ID to avoid collisions
                     seq_id = self._get_random_sequence_id()
-                    request = bytes([seq_id, CMD_READ_SENSOR, sensor_id])
+                    request = self._sensor_request(seq_id, sensor_id)
 
                     # Get sensor name for logging
-                    sensor_info = SENSOR_TYPES.get(sensor_id, {})
-                    sensor_name = sensor_info.get("name", f"0x{sensor_id:02x}")
+                    sensor_name = _SENSOR_NAMES[sensor_id]
 
-                    if sensor_id in [0x11, 0x12, 0x13]:  # PM10, TVOC, eCO2
+                    if sensor_id in PROBLEMATIC_SENSOR_IDS:
                         _LOGGER.info(
                             "[%s] Requesting sensor 0x%02x (seq=%02x)",
                             sensor_name, sensor_id, seq_id
                         )
 
                     # Format: (请求传感器数据)[0x seq-cmd-sensor] 实体XX 传感器名
-                    hex_parts = ' '.join([f'{b:02x}' for b in request])
-                    _LOGGER.debug(
-                        "[TX] [%d/%d] (请求传感器数据)[0x %s] 实体%02x %s",
-                        idx, sensor_count, hex_parts, sensor_id, sensor_name
-                    )
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "[TX] [%d/%d] (请求传感器数据)[0x %s] 实体%02x %s",
+                            idx, sensor_count, request.hex(' '), sensor_id, sensor_name
+                        )
 
                     # Create pending request and add to cache
-                    pending_request = PendingRequest(
-                        seq_id=seq_id,
-                        sensor_id=sensor_id,
-                        future=asyncio.Future(),
-                        timestamp=time.time()
-                    )
-                    request_key = (seq_id, sensor_id)
-                    self._pending_requests[request_key] = pending_request
-
+                    pending_request = self._register_request(seq_id, sensor_id)
 
                     # Send request
                     await client.write_gatt_char(EM1003_WRITE_CHAR_UUID, request, response=False)
+                    sent.append((idx, sensor_id, pending_request))
 
-
-                    # Wait for response with timeout
-                    try:
-                        await asyncio.wait_for(pending_request.future, timeout=2.0)
-                        # Get parsed value from sensor_data (set by notification handler)
-                        value = self.sensor_data.get(sensor_id)
-                        results[sensor_id] = value
-
-                        if sensor_id in [0x11, 0x12, 0x13]:  # PM10, TVOC, eCO2
-                            _LOGGER.info(
-                                "[%s] ✓ Got value: %s",
-                                sensor_name, value
-                            )
-
-                        _LOGGER.debug(
-                            "[REQ] [%d/%d] ✓ Sensor 0x%02x = %s",
-                            idx, sensor_count, sensor_id, value
-                        )
-                    except asyncio.TimeoutError:
-                        if sensor_id in [0x11, 0x12, 0x13]:  # PM10, TVOC, eCO2
-                            _LOGGER.warning(
-                                "[%s] ✗ TIMEOUT (2s) - sensor 0x%02x not responding",
-                                sensor_name, sensor_id
-                            )
-                        else:
-                            _LOGGER.warning(
-                                "[REQ] [%d/%d] ✗ Timeout waiting for sensor 0x%02x response (seq=%02x)",
-                                idx, sensor_count, sensor_id, seq_id
-                            )
-                        results[sensor_id] = None
-                        # Clean up pending request on timeout
-                        self._pending_requests.pop(request_key, None)
-                        self._used_seq_ids.discard(seq_id)
-
-                    # Small delay between sensor reads
-                    await asyncio.sleep(0.3)
+                    # Short pause so the device's write buffer is not overrun;
+                    # nothing follows the last write, so it goes straight to Phase 2
+                    if idx < sensor_count:
+                        await asyncio.sleep(self._pacing_delay)
 
                 except BleakError as err:
-                    if sensor_id in [0x11, 0x12, 0x13]:  # PM10, TVOC, eCO2
+                    if sensor_id in PROBLEMATIC_SENSOR_IDS:
                         _LOGGER.error(
                             "[%s] ✗ BLE error: %s",
                             sensor_name, err
@@ -1052,10 +1222,9 @@ class EM1003Device:
                             idx, sensor_count, sensor_id, err
                         )
                     results[sensor_id] = None
+                    slow_down = True
                     # Clean up on error
-                    request_key = (seq_id, sensor_id)
-                    self._pending_requests.pop(request_key, None)
-                    self._used_seq_ids.discard(seq_id)
+                    self._release_request((seq_id, sensor_id))
 
                     # If we get a BLE error, connection might be broken
                     # Check and abort if disconnected
@@ -1064,11 +1233,11 @@ class EM1003Device:
                             "[REQ] Connection lost after BLE error, aborting remaining reads"
                         )
                         # Mark remaining sensors as None
-                        for remaining_id in list(SENSOR_TYPES.keys())[idx:]:
+                        for remaining_id in SENSOR_IDS[idx:]:
                             results[remaining_id] = None
                         break
                 except Exception as err:
-                    if sensor_id in [0x11, 0x12, 0x13]:  # PM10, TVOC, eCO2
+                    if sensor_id in PROBLEMATIC_SENSOR_IDS:
                         _LOGGER.error(
                             "[%s] ✗ Error: %s",
                             sensor_name, err
@@ -1080,9 +1249,70 @@ class EM1003Device:
                         )
                     results[sensor_id] = None
                     # Clean up on error
-                    request_key = (seq_id, sensor_id)
-                    self._pending_requests.pop(request_key, None)
-                    self._used_seq_ids.discard(seq_id)
+                    self._release_request((seq_id, sensor_id))
+
+            # Phase 2: wait for all outstanding responses under one shared timeout
+            if sent:
+                await asyncio.wait(
+                    [pending_request.future for _, _, pending_request in sent],
+                    timeout=TIMEOUT_RESPONSE,
+                )
+
+            for idx, sensor_id, pending_request in sent:
+                sensor_name = _SENSOR_NAMES[sensor_id]
+                future = pending_request.future
+                if future.done() and not future.cancelled():
+                    # Get parsed value from sensor_data (set by notification handler)
+                    value = self.sensor_data.get(sensor_id)
+                    results[sensor_id] = value
+
+                    if sensor_id in PROBLEMATIC_SENSOR_IDS:
+                        _LOGGER.info(
+                            "[%s] ✓ Got value: %s",
+                            sensor_name, value
+                        )
+
+                    _LOGGER.debug(
+                        "[REQ] [%d/%d] ✓ Sensor 0x%02x = %s",
+                        idx, sensor_count, sensor_id, value
+                    )
+                else:
+                    if sensor_id in PROBLEMATIC_SENSOR_IDS:
+                        _LOGGER.warning(
+                            "[%s] ✗ TIMEOUT (%.0fs) - sensor 0x%02x not responding",
+                            sensor_name, TIMEOUT_RESPONSE, sensor_id
+                        )
+                    else:
+                        _LOGGER.warning(
+                            "[REQ] [%d/%d] ✗ Timeout waiting for sensor 0x%02x response (seq=%02x)",
+                            idx, sensor_count, sensor_id, pending_request.seq_id
+                        )
+                    results[sensor_id] = None
+                    slow_down = True
+                    # Clean up pending request on timeout
+                    self._release_request((pending_request.seq_id, sensor_id))
+
+            # Query the buzzer on the same connection so the coordinator does not
+            # have to reconnect for it after the teardown below; a failure only
+            # leaves buzzer_state as it was
+            try:
+                buzzer_seq_id = self._get_random_sequence_id()
+                buzzer_request = bytes((buzzer_seq_id,)) + BUZZER_QUERY_FRAME
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("[TX] (查询蜂鸣器状态)[0x %s]", buzzer_request.hex(' '))
+                if not await self._send_and_wait(client, buzzer_seq_id, 0x00, buzzer_request):
+                    _LOGGER.debug(
+                        "[BUZZER] Timeout waiting for buzzer state during poll (seq=%02x)",
+                        buzzer_seq_id
+                    )
+            except BleakError as err:
+                _LOGGER.debug("[BUZZER] Could not query buzzer state during poll: %s", err)
+
+            # Adapt pacing for the next poll: back off on trouble, speed up otherwise
+            if slow_down:
+                self._pacing_delay = min(0.5, self._pacing_delay * 2.0)
+            else:
+                self._pacing_delay = max(0.02, self._pacing_delay * 0.9)
 
             # Calculate success rate
             success_count = sum(1 for v in results.values() if v is not None)
@@ -1106,17 +1336,15 @@ class EM1003Device:
             # CRITICAL: Disconnect immediately after reading to free up connection slot
             # EM1003 device responds very fast (<2s), no need to keep connection open
             # This prevents "No backend with an available connection slot" errors
+            # The teardown runs in the background so results reach entities without
+            # waiting on BlueZ; the next connection attempt waits for it to finish
             if self._client and self._client.is_connected:
-                try:
-                    _LOGGER.info(
-                        "[CONN] Disconnecting after successful read to free connection slot"
-                    )
-                    await self.disconnect()
-                except Exception as disconnect_err:
-                    _LOGGER.debug(
-                        "[CONN] Error during post-read disconnect: %s",
-                        disconnect_err
-                    )
+                _LOGGER.info(
+                    "[CONN] Disconnecting after successful read to free connection slot"
+                )
+                self._disconnect_task = self.hass.async_create_task(
+                    self._safe_disconnect()
+                )
 
             return results
 
@@ -1152,6 +1380,8 @@ class EM1003Device:
                     _LOGGER.debug("[CONN] Error during error-path disconnect: %s", disconnect_err)
                 self._client = None
             raise
+        finally:
+            self._active_operations -= 1
 
     async def read_buzzer_state(self) -> bool | None:
         """Read current buzzer state.
@@ -1168,52 +1398,33 @@ class EM1003Device:
             )
             return None
 
-        # Clean up expired requests
-        self._cleanup_expired_requests()
-
+        # Counted as in flight so a background probe never overlaps this request
+        self._active_operations += 1
         try:
+            await self._wait_for_probe()
+
             # Ensure connection
             client = await self._ensure_connected()
 
             # Prepare request with random sequence ID
             # Query buzzer state: [seq_id][0x50][0x00]
             seq_id = self._get_random_sequence_id()
-            request = bytes([seq_id, CMD_BUZZER, 0x00])
-
-            hex_parts = ' '.join([f'{b:02x}' for b in request])
-            _LOGGER.debug(
-                "[TX] (查询蜂鸣器状态)[0x %s]",
-                hex_parts
-            )
+            request = bytes((seq_id,)) + BUZZER_QUERY_FRAME
 
-            # Create pending request and add to cache
-            pending_request = PendingRequest(
-                seq_id=seq_id,
-                sensor_id=0x00,  # Use 0x00 as placeholder for buzzer
-                future=asyncio.Future(),
-                timestamp=time.time()
-            )
-            request_key = (seq_id, 0x00)
-            self._pending_requests[request_key] = pending_request
-
-            # Send request
-            await client.write_gatt_char(EM1003_WRITE_CHAR_UUID, request, response=False)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[TX] (查询蜂鸣器状态)[0x %s]", request.hex(' '))
 
-            # Wait for response with timeout
-            try:
-                await asyncio.wait_for(pending_request.future, timeout=2.0)
+            # Use 0x00 as placeholder sensor ID for buzzer query
+            if await self._send_and_wait(client, seq_id, 0x00, request):
                 self._circuit_breaker.record_success()
                 return self.buzzer_state
-            except asyncio.TimeoutError:
-                _LOGGER.warning(
-                    "Timeout waiting for buzzer state response (seq=%02x)",
-                    seq_id
-                )
-                # Clean up pending request
-                self._pending_requests.pop(request_key, None)
-                self._used_seq_ids.discard(seq_id)
-                self._circuit_breaker.record_failure()
-                return None
+
+            _LOGGER.warning(
+                "Timeout waiting for buzzer state response (seq=%02x)",
+                seq_id
+            )
+            self._circuit_breaker.record_failure()
+            return None
 
         except BleakError as err:
             _LOGGER.error("Bleak error reading buzzer state: %s", err)
@@ -1221,10 +1432,12 @@ class EM1003Device:
             self._client = None
             return None
         except Exception as err:
-            _LOGGER.error("Error reading buzzer state: %s", err, exc_info=True)
+            self._log_unexpected_error("Error reading buzzer state: %s", err)
             self._circuit_breaker.record_failure()
             self._client = None
             return None
+        finally:
+            self._active_operations -= 1
 
     async def set_buzzer_state(self, turn_on: bool) -> bool:
         """Set buzzer state.
@@ -1244,111 +1457,82 @@ class EM1003Device:
             )
             return False
 
-        # Clean up expired requests
-        self._cleanup_expired_requests()
-
+        # Counted as in flight so a background probe never overlaps this request
+        self._active_operations += 1
         try:
+            await self._wait_for_probe()
+
             # Ensure connection
             client = await self._ensure_connected()
 
             # Prepare request with random sequence ID
             # Set buzzer state: [seq_id][0x50][0x01][state]
             seq_id = self._get_random_sequence_id()
-            state_byte = BUZZER_ON if turn_on else BUZZER_OFF
-            request = bytes([seq_id, CMD_BUZZER, 0x01, state_byte])
-
-            hex_parts = ' '.join([f'{b:02x}' for b in request])
-            _LOGGER.debug(
-                "[TX] (设置蜂鸣器状态)[0x %s] %s",
-                hex_parts,
-                "开启" if turn_on else "关闭"
-            )
-
-            # Create pending request and add to cache
-            pending_request = PendingRequest(
-                seq_id=seq_id,
-                sensor_id=0x01,  # Use 0x01 for buzzer set operation
-                future=asyncio.Future(),
-                timestamp=time.time()
-            )
-            request_key = (seq_id, 0x01)
-            self._pending_requests[request_key] = pending_request
-
-            # Send request
-            await client.write_gatt_char(EM1003_WRITE_CHAR_UUID, request, response=False)
-
-            # Wait for response with timeout
-            try:
-                await asyncio.wait_for(pending_request.future, timeout=2.0)
-
-                # Set command received, now query to verify the actual state
-                # The set response may not contain reliable state info, so we query separately
-                _LOGGER.debug("[BUZZER] Set command acknowledged, querying actual state...")
-
-                # Small delay to allow device to process the command
-                await asyncio.sleep(0.1)
+            request = bytes((seq_id,)) + BUZZER_SET_FRAMES[BUZZER_ON if turn_on else BUZZER_OFF]
 
-                # Query current state
-                query_seq_id = self._get_random_sequence_id()
-                query_request = bytes([query_seq_id, CMD_BUZZER, 0x00])
-
-                query_hex = ' '.join([f'{b:02x}' for b in query_request])
-                _LOGGER.debug("[TX] (验证蜂鸣器状态)[0x %s]", query_hex)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "[TX] (设置蜂鸣器状态)[0x %s] %s",
+                    request.hex(' '),
+                    "开启" if turn_on else "关闭"
+                )
 
-                # Create pending request for query
-                query_pending = PendingRequest(
-                    seq_id=query_seq_id,
-                    sensor_id=0x00,
-                    future=asyncio.Future(),
-                    timestamp=time.time()
+            # Use 0x01 as placeholder sensor ID for buzzer set operation
+            if not await self._send_and_wait(client, seq_id, 0x01, request):
+                _LOGGER.warning(
+                    "Timeout waiting for buzzer response (set seq=%02x)",
+                    seq_id
                 )
-                query_key = (query_seq_id, 0x00)
-                self._pending_requests[query_key] = query_pending
+                self._circuit_breaker.record_failure()
+                return False
 
-                # Send query request
-                await client.write_gatt_char(EM1003_WRITE_CHAR_UUID, query_request, response=False)
+            # Set command received, now query to verify the actual state
+            # The set response may not contain reliable state info, so we query separately
+            _LOGGER.debug("[BUZZER] Set command acknowledged, querying actual state...")
 
-                # Wait for query response
-                await asyncio.wait_for(query_pending.future, timeout=2.0)
+            # Small delay to allow device to process the command
+            await asyncio.sleep(0.1)
 
-                # Now verify the state
-                if self.buzzer_state == turn_on:
-                    _LOGGER.info(
-                        "[BUZZER] ✓ Successfully %s buzzer (verified)",
-                        "turned on" if turn_on else "turned off"
-                    )
-                    self._circuit_breaker.record_success()
-                    return True
-                else:
-                    _LOGGER.warning(
-                        "[BUZZER] ✗ State mismatch after verification: expected %s, got %s",
-                        turn_on, self.buzzer_state
-                    )
-                    self._circuit_breaker.record_failure()
-                    return False
+            # Query current state
+            query_seq_id = self._get_random_sequence_id()
+            query_request = bytes((query_seq_id,)) + BUZZER_QUERY_FRAME
 
-            except asyncio.TimeoutError:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[TX] (验证蜂鸣器状态)[0x %s]", query_request.hex(' '))
+
+            if not await self._send_and_wait(client, query_seq_id, 0x00, query_request):
                 _LOGGER.warning(
-                    "Timeout waiting for buzzer response (set seq=%02x)",
-                    seq_id
+                    "Timeout waiting for buzzer response (query seq=%02x)",
+                    query_seq_id
                 )
-                # Clean up any pending requests
-                self._pending_requests.pop((seq_id, 0x01), None)
-                self._used_seq_ids.discard(seq_id)
-                # Also clean up query request if it exists
-                if 'query_seq_id' in locals():
-                    self._pending_requests.pop((query_seq_id, 0x00), None)
-                    self._used_seq_ids.discard(query_seq_id)
                 self._circuit_breaker.record_failure()
                 return False
 
+            # Now verify the state
+            if self.buzzer_state == turn_on:
+                _LOGGER.info(
+                    "[BUZZER] ✓ Successfully %s buzzer (verified)",
+                    "turned on" if turn_on else "turned off"
+                )
+                self._circuit_breaker.record_success()
+                return True
+
+            _LOGGER.warning(
+                "[BUZZER] ✗ State mismatch after verification: expected %s, got %s",
+                turn_on, self.buzzer_state
+            )
+            self._circuit_breaker.record_failure()
+            return False
+
         except BleakError as err:
             _LOGGER.error("Bleak error setting buzzer state: %s", err)
             self._circuit_breaker.record_failure()
             self._client = None
             return False
         except Exception as err:
-            _LOGGER.error("Error setting buzzer state: %s", err, exc_info=True)
+            self._log_unexpected_error("Error setting buzzer state: %s", err)
             self._circuit_breaker.record_failure()
             self._client = None
             return False
+        finally:
+            self._active_operations -= 1
@@ -1,9 +1,8 @@
 """Sensor platform for EM1003 BLE Sensor integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,19 +10,40 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    DOMAIN,
+    SENSOR_TYPES_ITEMS,
+    SENSOR_NOTES,
+    SensorDef,
 )
-
-from .const import DOMAIN, CONF_MAC_ADDRESS, SENSOR_TYPES, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .coordinator import EM1003DataUpdateCoordinator, EM1003EntryData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map string device classes to SensorDeviceClass enum
+# Use getattr to handle older HA versions that may not have all device classes
+_DEVICE_CLASS_MAP = {
+    "temperature": getattr(SensorDeviceClass, "TEMPERATURE", None),
+    "humidity": getattr(SensorDeviceClass, "HUMIDITY", None),
+    "pm25": getattr(SensorDeviceClass, "PM25", None),
+    "pm10": getattr(SensorDeviceClass, "PM10", None),
+    "carbon_dioxide": getattr(SensorDeviceClass, "CARBON_DIOXIDE", None),
+    "volatile_organic_compounds": getattr(SensorDeviceClass, "VOLATILE_ORGANIC_COMPOUNDS", None),
+}
+
+# Display precision by sensor ID; other sensors (PM2.5, PM10, Noise, TVOC, eCO2) show no decimals
+_PRECISION_BY_ID = {
+    0x01: 2,  # Temperature
+    0x06: 1,  # Humidity
+    0x0A: 3,  # Formaldehyde
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,116 +51,23 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up EM1003 sensor based on a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
-    mac_address = data[CONF_MAC_ADDRESS]
-    device_name = data.get("device_name", config_entry.title)
-    em1003_device = data["device"]
+    entry_data: EM1003EntryData = hass.data[DOMAIN][config_entry.entry_id]
+    mac_address, device_name, _, coordinator = entry_data
 
     _LOGGER.info("Setting up EM1003 sensors for device: %s (%s)", device_name, mac_address)
 
-    # Get scan interval from options or use default
-    scan_interval_seconds = config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    scan_interval = timedelta(seconds=scan_interval_seconds)
-    _LOGGER.info("Using scan interval: %d seconds", scan_interval_seconds)
-
-    # Create coordinator for updating sensor data
-    coordinator = EM1003DataUpdateCoordinator(hass, em1003_device, mac_address, scan_interval)
-
-    # Store coordinator in hass.data so switch can access it
-    hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
-
-    # Add a small delay before first refresh to allow device to be ready
-    _LOGGER.debug("Waiting for device to be ready before initial refresh...")
-    await asyncio.sleep(2.0)
-
-    # Fetch initial data with better error handling
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.warning(
-            "Initial data fetch failed for %s, sensors will retry automatically: %s",
-            mac_address,
-            err
-        )
-        # Don't fail setup - let sensors show unavailable and retry later
-
     # Create sensor entities for each sensor type
-    entities = []
-    for sensor_id, sensor_info in SENSOR_TYPES.items():
-        entities.append(
-            EM1003Sensor(
-                coordinator,
-                config_entry,
-                mac_address,
-                device_name,
-                sensor_id,
-                sensor_info,
-            )
-        )
-
-    async_add_entities(entities)
-
-
-class EM1003DataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching EM1003 data from the device."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        em1003_device,
-        mac_address: str,
-        update_interval: timedelta,
-    ) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"EM1003 {mac_address}",
-            update_interval=update_interval,
+    async_add_entities([
+        EM1003Sensor(
+            coordinator,
+            config_entry,
+            mac_address,
+            device_name,
+            sensor_id,
+            sensor_info,
         )
-        self.em1003_device = em1003_device
-        self.mac_address = mac_address
-
-    async def _async_update_data(self) -> dict:
-        """Fetch data from the device."""
-        try:
-            _LOGGER.debug("Updating sensor data for %s", self.mac_address)
-            data = await self.em1003_device.read_all_sensors()
-
-            # Also update buzzer state periodically to keep switch in sync
-            # This prevents the switch from staying unavailable if state gets out of sync
-            try:
-                _LOGGER.debug("Querying buzzer state for %s", self.mac_address)
-                buzzer_state = await self.em1003_device.read_buzzer_state()
-                if buzzer_state is not None:
-                    _LOGGER.debug("Buzzer state updated: %s", "ON" if buzzer_state else "OFF")
-            except Exception as buzzer_err:
-                _LOGGER.debug("Could not update buzzer state: %s", buzzer_err)
-                # Don't fail the entire update if buzzer query fails
-
-            # Check if we actually received any valid data
-            valid_count = sum(1 for v in data.values() if v is not None)
-            if valid_count == 0:
-                raise UpdateFailed(
-                    f"Failed to read any sensor data from {self.mac_address} - "
-                    "connection or device issue"
-                )
-
-            _LOGGER.debug("Sensor data updated: %s (valid: %d/%d)", data, valid_count, len(data))
-
-            # Log if problematic sensors have no data
-            if data:
-                for sensor_id in [0x11, 0x12, 0x13]:  # PM10, TVOC, eCO2
-                    value = data.get(sensor_id)
-                    if value is None:
-                        from .const import SENSOR_TYPES
-                        sensor_info = SENSOR_TYPES.get(sensor_id, {})
-                        sensor_name = sensor_info.get("name", f"0x{sensor_id:02x}")
-                        _LOGGER.info("[%s] No data received", sensor_name)
-
-            return data
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with device: {err}") from err
+        for sensor_id, sensor_info in SENSOR_TYPES_ITEMS
+    ])
 
 
 class EM1003Sensor(CoordinatorEntity, SensorEntity):
@@ -156,7 +83,7 @@ class EM1003Sensor(CoordinatorEntity, SensorEntity):
         mac_address: str,
         device_name: str,
         sensor_id: int,
-        sensor_info: dict,
+        sensor_info: SensorDef,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -167,29 +94,19 @@ class EM1003Sensor(CoordinatorEntity, SensorEntity):
         self._sensor_info = sensor_info
 
         # Set entity attributes
-        self._attr_unique_id = f"{mac_address}_{sensor_info['key']}"
-        self._attr_name = sensor_info["name"]
-        self._attr_icon = sensor_info["icon"]
-        self._attr_native_unit_of_measurement = sensor_info.get("unit")
+        self._attr_unique_id = f"{mac_address}_{sensor_info.key}"
+        self._attr_name = sensor_info.name
+        self._attr_icon = sensor_info.icon
+        self._attr_native_unit_of_measurement = sensor_info.unit
 
-        # Set device class if available - use explicit mapping with getattr for compatibility
-        device_class_str = sensor_info.get("device_class")
+        # Set device class if available
+        device_class_str = sensor_info.device_class
         if device_class_str:
-            # Map string device classes to SensorDeviceClass enum
-            # Use getattr to handle older HA versions that may not have all device classes
-            device_class_map = {
-                "temperature": getattr(SensorDeviceClass, "TEMPERATURE", None),
-                "humidity": getattr(SensorDeviceClass, "HUMIDITY", None),
-                "pm25": getattr(SensorDeviceClass, "PM25", None),
-                "pm10": getattr(SensorDeviceClass, "PM10", None),
-                "carbon_dioxide": getattr(SensorDeviceClass, "CARBON_DIOXIDE", None),
-                "volatile_organic_compounds": getattr(SensorDeviceClass, "VOLATILE_ORGANIC_COMPOUNDS", None),
-            }
-            self._attr_device_class = device_class_map.get(device_class_str)
+            self._attr_device_class = _DEVICE_CLASS_MAP.get(device_class_str)
             if self._attr_device_class:
                 _LOGGER.debug(
                     "Set device_class for sensor %s (0x%02x): %s",
-                    sensor_info["name"],
+                    sensor_info.name,
                     sensor_id,
                     self._attr_device_class
                 )
@@ -197,128 +114,153 @@ class EM1003Sensor(CoordinatorEntity, SensorEntity):
                 _LOGGER.debug(
                     "Device class '%s' not available in this Home Assistant version for sensor %s (0x%02x)",
                     device_class_str,
-                    sensor_info["name"],
+                    sensor_info.name,
                     sensor_id
                 )
 
         # Set precision based on sensor type
-        if sensor_id == 0x01:  # Temperature
-            self._attr_suggested_display_precision = 2
-        elif sensor_id == 0x06:  # Humidity
-            self._attr_suggested_display_precision = 1
-        elif sensor_id == 0x0A:  # Formaldehyde
-            self._attr_suggested_display_precision = 3
-        else:  # Other sensors (no decimals): PM2.5, PM10, Noise, TVOC, eCO2
-            self._attr_suggested_display_precision = 0
-
-        # Cache for last valid value and timestamp
-        self._last_valid_value: float | None = None
-        self._last_update_time: datetime | None = None
-        self._stale_threshold = timedelta(minutes=20)
+        self._attr_suggested_display_precision = _PRECISION_BY_ID.get(sensor_id, 0)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this EM1003 device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._mac_address)},
-            name=self._device_name,
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, mac_address)},
+            name=device_name,
             manufacturer="EM1003",
             model="BLE Air Quality Sensor",
-            connections={("mac", self._mac_address)},
+            connections={("mac", mac_address)},
         )
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available.
+        # "Name (0xNN)" prefix for value log messages
+        self._sensor_id_hex = f"0x{sensor_id:02x}"
+        self._log_tag = f"{sensor_info.name} ({self._sensor_id_hex})"
+
+        # Attributes never change for this entity. Poll freshness is not exposed:
+        # unchanged readings do not write state, so it would freeze at the last change
+        self._attr_extra_state_attributes = {
+            "sensor_id": self._sensor_id_hex,
+            "note": SENSOR_NOTES.get(sensor_id, "Unknown sensor type"),
+            "mac_address": mac_address,
+        }
+
+        # Cache for last valid value; when it was last reported comes from the
+        # coordinator's sensor_last_seen, stamped on every successful poll
+        self._last_valid_value: float | None = None
+        self._stale_threshold = 1200.0  # 20 minutes
+
+        # State is computed per coordinator update rather than per property read;
+        # a timer re-evaluates a cached value when it would go stale
+        self._attr_native_value: float | None = None
+        self._attr_available = False
+        self._stale_unsub: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the cache and state from data fetched before the entity was added."""
+        await super().async_added_to_hass()
+        self._update_cache()
+        self._refresh_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending staleness check."""
+        self._cancel_stale_check()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the value cache and state once per coordinator update, then write state."""
+        self._update_cache()
+        self._refresh_state()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_stale(self, _now) -> None:
+        """Re-evaluate a cached value once it reaches the staleness threshold."""
+        self._stale_unsub = None
+        self._refresh_state()
+        self.async_write_ha_state()
+
+    def _cancel_stale_check(self) -> None:
+        """Cancel the scheduled staleness re-evaluation, if any."""
+        if self._stale_unsub is not None:
+            self._stale_unsub()
+            self._stale_unsub = None
+
+    def _coordinator_value(self) -> float | None:
+        """Return this sensor's value from the coordinator's latest poll, if any."""
+        data = self.coordinator.data
+        return data.sensors.get(self._sensor_id) if data is not None else None
+
+    def _update_cache(self) -> None:
+        """Remember the coordinator's current value."""
+        # After a failed poll the coordinator still holds the previous data;
+        # those values are not new and must not be re-stamped
+        if not self.coordinator.last_update_success:
+            return
+        current_value = self._coordinator_value()
+        if current_value is not None:
+            self._last_valid_value = current_value
+
+    def _refresh_state(self) -> None:
+        """Set native value and availability from fresh or cached data.
 
         Consider sensor available if:
         1. Coordinator has fresh data, OR
         2. We have cached data that's less than 20 minutes old
         """
-        # Check if we have fresh data from coordinator
-        if self.coordinator.last_update_success:
-            if self.coordinator.data is not None:
-                current_value = self.coordinator.data.get(self._sensor_id)
-                if current_value is not None:
-                    return True
-
-        # Check if we have recent cached data
-        if self._last_valid_value is not None and self._last_update_time is not None:
-            time_since_update = datetime.now() - self._last_update_time
-            if time_since_update < self._stale_threshold:
-                # Cached data is fresh enough
-                return True
+        self._cancel_stale_check()
 
-        # No fresh or cached data available
-        return False
+        # Get current value from coordinator; data left over from before a
+        # failed poll is handled as cached, so the staleness timer still runs
+        if self.coordinator.last_update_success:
+            current_value = self._coordinator_value()
+        else:
+            current_value = None
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        # Get current value from coordinator
-        current_value = None
-        if self.coordinator.data is not None:
-            current_value = self.coordinator.data.get(self._sensor_id)
-
-        # If we have a valid new value, update cache
         if current_value is not None:
-            self._last_valid_value = current_value
-            self._last_update_time = datetime.now()
-
-            _LOGGER.debug(
-                "[VALUE] %s (0x%02x): Fresh value = %s",
-                self._sensor_info["name"],
-                self._sensor_id,
-                current_value
-            )
-            return current_value
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[VALUE] %s: Fresh value = %s", self._log_tag, current_value)
+            self._attr_native_value = current_value
+            self._attr_available = True
+            return
 
         # No new data available, check if we should use cached value
-        if self._last_valid_value is not None and self._last_update_time is not None:
-            time_since_update = datetime.now() - self._last_update_time
-
-            # If less than 20 minutes, return cached value
-            if time_since_update < self._stale_threshold:
-                _LOGGER.debug(
-                    "[VALUE] %s (0x%02x): Using cached value %s (age: %d seconds)",
-                    self._sensor_info["name"],
-                    self._sensor_id,
-                    self._last_valid_value,
-                    int(time_since_update.total_seconds())
-                )
-                return self._last_valid_value
-            else:
-                # Data is too old, mark as unavailable
-                _LOGGER.warning(
-                    "[VALUE] %s (0x%02x): Data stale for %d minutes, returning None",
-                    self._sensor_info["name"],
-                    self._sensor_id,
-                    int(time_since_update.total_seconds() / 60)
+        last_seen = self.coordinator.sensor_last_seen.get(self._sensor_id)
+        if self._last_valid_value is not None and last_seen is not None:
+            age = time.monotonic() - last_seen
+
+            # If less than 20 minutes, use cached value until it goes stale
+            if age < self._stale_threshold:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[VALUE] %s: Using cached value %s (age: %d seconds)",
+                        self._log_tag,
+                        self._last_valid_value,
+                        int(age)
+                    )
+                self._attr_native_value = self._last_valid_value
+                self._attr_available = True
+                self._stale_unsub = async_call_later(
+                    self.hass, self._stale_threshold - age, self._handle_stale
                 )
+                return
+
+            # Data is too old, mark as unavailable
+            _LOGGER.warning(
+                "[VALUE] %s: Data stale for %d minutes, returning None",
+                self._log_tag,
+                int(age / 60)
+            )
 
         # No valid data available
-        _LOGGER.debug(
-            "[VALUE] %s (0x%02x): No data available (coordinator_data=%s, cached=%s)",
-            self._sensor_info["name"],
-            self._sensor_id,
-            self.coordinator.data is not None,
-            self._last_valid_value is not None
-        )
-        return None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[VALUE] %s: No data available (coordinator_data=%s, cached=%s)",
+                self._log_tag,
+                self.coordinator.data is not None,
+                self._last_valid_value is not None
+            )
+        self._attr_native_value = None
+        self._attr_available = False
 
     @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes."""
-        attrs = {
-            "sensor_id": f"0x{self._sensor_id:02x}",
-            "note": self._sensor_info.get("note", "Unknown sensor type"),
-            "mac_address": self._mac_address,
-        }
-
-        # Add last update information if available
-        if self._last_update_time is not None:
-            attrs["last_update"] = self._last_update_time.isoformat()
-            time_since_update = datetime.now() - self._last_update_time
-            attrs["data_age_seconds"] = int(time_since_update.total_seconds())
-
-        return attrs
+    def available(self) -> bool:
+        """Return if entity is available, as last computed by _refresh_state()."""
+        return self._attr_available
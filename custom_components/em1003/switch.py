@@ -1,16 +1,20 @@
 """Switch platform for EM1003 BLE Sensor integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_MAC_ADDRESS
+from .const import DOMAIN
+from .coordinator import EM1003EntryData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,11 +25,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up EM1003 switch based on a config entry."""
-    data = hass.data[DOMAIN][config_entry.entry_id]
-    mac_address = data[CONF_MAC_ADDRESS]
-    device_name = data.get("device_name", config_entry.title)
-    em1003_device = data["device"]
-    coordinator = data.get("coordinator")
+    entry_data: EM1003EntryData = hass.data[DOMAIN][config_entry.entry_id]
+    mac_address, device_name, em1003_device, coordinator = entry_data
 
     _LOGGER.info("Setting up EM1003 buzzer switch for device: %s (%s)", device_name, mac_address)
 
@@ -44,6 +45,19 @@ async def async_setup_entry(
 class EM1003BuzzerSwitch(SwitchEntity):
     """Representation of an EM1003 buzzer switch."""
 
+    # Entity itself has no __slots__, so instances keep a __dict__ for the
+    # inherited _attr_* state; only this class's own attributes are slotted
+    __slots__ = (
+        "_config_entry",
+        "_mac_address",
+        "_device_name",
+        "_em1003_device",
+        "_coordinator",
+        "_coordinator_listener",
+        "_pending_target",
+        "_worker_task",
+    )
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -65,25 +79,25 @@ class EM1003BuzzerSwitch(SwitchEntity):
         self._attr_unique_id = f"{mac_address}_buzzer"
         self._attr_name = "Buzzer"
         self._attr_icon = "mdi:volume-high"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, mac_address)},
+            name=device_name,
+            manufacturer="EM1003",
+            model="BLE Air Quality Sensor",
+            connections={("mac", mac_address)},
+        )
+        self._attr_extra_state_attributes = {"mac_address": mac_address}
 
         # State tracking
         self._attr_is_on = None
         self._attr_available = True
 
-        # Subscribe to coordinator updates if available
-        if self._coordinator:
-            self._coordinator_listener = None
+        # Latest requested buzzer state and the worker applying it
+        self._pending_target: bool | None = None
+        self._worker_task: asyncio.Task | None = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this EM1003 device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._mac_address)},
-            name=self._device_name,
-            manufacturer="EM1003",
-            model="BLE Air Quality Sensor",
-            connections={("mac", self._mac_address)},
-        )
+        # Set in async_added_to_hass when a coordinator is available
+        self._coordinator_listener: Callable[[], None] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -95,30 +109,50 @@ class EM1003BuzzerSwitch(SwitchEntity):
                 self._handle_coordinator_update
             )
 
-        # Try to read initial buzzer state
+        # The coordinator's first refresh usually queried the buzzer already
+        if self._em1003_device.buzzer_state is not None:
+            self._attr_is_on = self._em1003_device.buzzer_state
+            return
+
+        # Otherwise read it in the background so entity setup is not held on BLE
+        self.hass.async_create_background_task(
+            self._async_read_initial_state(),
+            f"{DOMAIN} {self._mac_address} initial buzzer state",
+        )
+
+    async def _async_read_initial_state(self) -> None:
+        """Read the buzzer state from the device when no cached value exists."""
         try:
             _LOGGER.debug("Reading initial buzzer state for %s", self._mac_address)
-            state = await self._em1003_device.read_buzzer_state()
+            if self._coordinator is not None and not self._coordinator.last_update_success:
+                # The setup poll failed, so the sensors need a new poll anyway;
+                # it queries the buzzer on the same connection
+                await self._coordinator.async_request_refresh()
+                state = self._em1003_device.buzzer_state
+            else:
+                # Only the buzzer query was missed; one read is cheaper than a full poll
+                state = await self._em1003_device.read_buzzer_state()
             if state is not None:
-                self._attr_is_on = state
                 _LOGGER.info(
                     "Initial buzzer state for %s: %s",
                     self._mac_address,
                     "ON" if state else "OFF"
                 )
+                # A turn on/off may have completed while the read was in flight
+                if self._attr_is_on is None:
+                    self._attr_is_on = state
+                    self.async_write_ha_state()
             else:
                 _LOGGER.warning(
                     "Could not read initial buzzer state for %s, will retry on first interaction",
                     self._mac_address
                 )
-                self._attr_is_on = None
         except Exception as err:
             _LOGGER.warning(
                 "Error reading initial buzzer state for %s: %s",
                 self._mac_address,
                 err
             )
-            self._attr_is_on = None
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
@@ -129,69 +163,97 @@ class EM1003BuzzerSwitch(SwitchEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Sync state from device object (updated by coordinator's buzzer query)
-        if self._em1003_device.buzzer_state is not None:
-            if self._attr_is_on != self._em1003_device.buzzer_state:
-                _LOGGER.debug(
-                    "Syncing buzzer state from coordinator for %s: %s -> %s",
-                    self._mac_address,
-                    "ON" if self._attr_is_on else "OFF" if self._attr_is_on is not None else "Unknown",
-                    "ON" if self._em1003_device.buzzer_state else "OFF"
-                )
-                self._attr_is_on = self._em1003_device.buzzer_state
-                self._attr_available = True
-                self.async_write_ha_state()
+        new_state = self._em1003_device.buzzer_state
+        if new_state is None or new_state == self._attr_is_on:
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            old_state = self._attr_is_on
+            _LOGGER.debug(
+                "Syncing buzzer state from coordinator for %s: %s -> %s",
+                self._mac_address,
+                "Unknown" if old_state is None else "ON" if old_state else "OFF",
+                "ON" if new_state else "OFF"
+            )
+        self._attr_is_on = new_state
+        self._attr_available = True
+        self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the buzzer on."""
-        _LOGGER.debug("Turning on buzzer for %s", self._mac_address)
-
-        try:
-            success = await self._em1003_device.set_buzzer_state(True)
-
-            if success:
-                self._attr_is_on = True
-                self._attr_available = True
-                _LOGGER.info("Successfully turned on buzzer for %s", self._mac_address)
-            else:
-                _LOGGER.error("Failed to turn on buzzer for %s", self._mac_address)
-                self._attr_available = False
-
-            # Trigger state update
-            self.async_write_ha_state()
-
-        except Exception as err:
-            _LOGGER.error("Error turning on buzzer for %s: %s", self._mac_address, err)
-            self._attr_available = False
-            self.async_write_ha_state()
-            raise
+        await self._async_set_buzzer(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the buzzer off."""
-        _LOGGER.debug("Turning off buzzer for %s", self._mac_address)
+        await self._async_set_buzzer(False)
+
+    async def _async_set_buzzer(self, target: bool) -> None:
+        """Queue a buzzer state and wait until the latest queued state is applied.
+
+        Rapid on/off requests collapse: one worker applies only the most recent
+        target, so intermediate states are never written to the device.
+        """
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Turning %s buzzer for %s", "on" if target else "off", self._mac_address
+            )
+        self._pending_target = target
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = self.hass.async_create_task(self._drain_buzzer_requests())
+        # Shield so a cancelled service call does not abort the shared worker
+        error = await asyncio.shield(self._worker_task)
+        if error is not None:
+            action, err = error
+            raise HomeAssistantError(
+                f"Error turning {action} buzzer for {self._mac_address}: {err}"
+            ) from err
+
+    async def _drain_buzzer_requests(self) -> tuple[str, Exception] | None:
+        """Apply queued buzzer targets until no newer one is waiting.
+
+        Returns the error from the last target applied, which every caller
+        waiting on this worker reports, or None if it succeeded.
+        """
+        error = None
+        while self._pending_target is not None:
+            target = self._pending_target
+            self._pending_target = None
+            error = await self._async_apply_buzzer(target)
+        return error
+
+    async def _async_apply_buzzer(self, target: bool) -> tuple[str, Exception] | None:
+        """Write one buzzer state to the device and update the entity.
+
+        Returns the action and exception if the write raised, otherwise None.
+        """
+        action = "on" if target else "off"
+
+        # Remember the current state so unchanged results skip the state write
+        previous = (self._attr_is_on, self._attr_available)
 
         try:
-            success = await self._em1003_device.set_buzzer_state(False)
+            success = await self._em1003_device.set_buzzer_state(target)
 
             if success:
-                self._attr_is_on = False
+                self._attr_is_on = target
                 self._attr_available = True
-                _LOGGER.info("Successfully turned off buzzer for %s", self._mac_address)
+                # The state write below already reports the change; keep this at debug
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Successfully turned %s buzzer for %s", action, self._mac_address)
             else:
-                _LOGGER.error("Failed to turn off buzzer for %s", self._mac_address)
+                _LOGGER.error("Failed to turn %s buzzer for %s", action, self._mac_address)
                 self._attr_available = False
 
-            # Trigger state update
-            self.async_write_ha_state()
+            # Trigger state update only if something changed
+            if (self._attr_is_on, self._attr_available) != previous:
+                self.async_write_ha_state()
+            return None
 
         except Exception as err:
-            _LOGGER.error("Error turning off buzzer for %s: %s", self._mac_address, err)
+            # Returned rather than raised so the worker keeps serving newer
+            # targets; the waiting service calls raise it
+            _LOGGER.error("Error turning %s buzzer for %s: %s", action, self._mac_address, err)
             self._attr_available = False
-            self.async_write_ha_state()
-            raise
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes."""
-        return {
-            "mac_address": self._mac_address,
-        }
+            if previous[1]:
+                self.async_write_ha_state()
+            return action, err